@@ -1,7 +1,11 @@
+import queue
+import shutil
 import sys
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, ttk
 from pathlib import Path
+from typing import Callable, Optional
 
 from core.paths import PathManager
 from core.backup import BackupManager
@@ -9,11 +13,23 @@ from core.mod_manager import ModManager
 from core.config import ConfigManager
 from core.profile_manager import ProfileManager
 from core.logger import AppLogger
-from ui.styles import apply_dark_theme, COLORS
+from ui.styles import apply_dark_theme, COLORS, COMBOBOX_POPUP_OPTIONS
 from ui.components import StatusBar, ActionButton, ModTreeView, ExpandableLogViewer
 from ui.dialogs import show_error, show_info, show_success, show_warning, ask_string, ask_yes_no, show_profile_dialog
 
 
+SAVE_DELAY_MS = 500
+
+MOD_ARCHIVE_EXTENSIONS = ('.zip', '.rar')
+
+ARCHIVE_FILETYPES = (
+    ("Archive files", "*.zip *.rar *.7z"),
+    ("ZIP files", "*.zip"),
+    ("RAR files", "*.rar"),
+    ("All files", "*.*")
+)
+
+
 class FM26ModManagerApp:
     """Main application coordinating all mod management operations."""
 
@@ -22,19 +38,32 @@ class FM26ModManagerApp:
         self.dnd_available = dnd_available
         self.root.title("FM26 Mod Manager")
         self.root.geometry("1000x750")
-        self.root.configure(bg=COLORS['bg_primary'])
         self.root.minsize(900, 600)
 
-        # Configure Combobox dropdown popup colors
-        self.root.option_add('*TCombobox*Listbox.background', COLORS['bg_tertiary'])
-        self.root.option_add('*TCombobox*Listbox.foreground', COLORS['fg_primary'])
-        self.root.option_add('*TCombobox*Listbox.selectBackground', COLORS['accent_emphasis'])
-        self.root.option_add('*TCombobox*Listbox.selectForeground', '#ffffff')
-        self.root.option_add('*TCombobox*Listbox.font', ('Segoe UI', 10))
+        # Theme and option defaults go in before any widget is created
+        apply_dark_theme(ttk.Style(self.root))
+        for pattern, value in COMBOBOX_POPUP_OPTIONS.items():
+            self.root.option_add(pattern, value)
+        self.root.configure(bg=COLORS['bg_primary'])
 
         self.path_manager = PathManager()
         self.fm_root_path = None
         self.data_path = None
+        self._storage_base = None
+
+        # Long-running file work runs on a single worker thread so the Tk
+        # event loop stays responsive; results are handed back via root.after
+        self._worker = ThreadPoolExecutor(max_workers=1)
+        self._busy = False
+        self._pending_mod_files = []
+        self._draining_mod_queue = False
+        # Mods added from a multi-file drop, summarized in one dialog at the end
+        self._batch_reports = None
+        # Status updates posted by the worker, shown by _poll_background
+        self._progress_queue = queue.Queue()
+
+        # Config writes are coalesced so bursts of changes hit disk once
+        self._save_pending = None
 
         self.fm_root_path = self.path_manager.detect_installation()
         if self.fm_root_path:
@@ -42,6 +71,12 @@ class FM26ModManagerApp:
 
         self._setup_storage()
 
+        # Older versions extracted archives into a temp folder; clear leftovers
+        # off the Tk thread
+        stale_temp = self.backup_dir / "temp_extract"
+        if stale_temp.exists():
+            self._worker.submit(shutil.rmtree, stale_temp, True)
+
         # Initialize logger
         log_file = self.backup_dir / "fm26_mod_manager.log"
         self.logger = AppLogger(log_file)
@@ -66,23 +101,26 @@ class FM26ModManagerApp:
 
     def _setup_storage(self):
         """Initialize config and backup directory paths."""
-        try:
-            if self.fm_root_path:
-                base_path = Path(self.fm_root_path) / ".fm26_mod_manager"
-            else:
-                base_path = Path.home() / ".fm26_mod_manager"
+        if self.fm_root_path:
+            base_path = Path(self.fm_root_path) / ".fm26_mod_manager"
+        else:
+            base_path = Path.home() / ".fm26_mod_manager"
 
-            base_path.mkdir(exist_ok=True)
-            self.config_file = base_path / "config.json"
-            self.backup_dir = base_path / "backups"
-            self.backup_dir.mkdir(exist_ok=True)
+        # Re-browsing to the same installation needs no directory work
+        if base_path == self._storage_base:
+            return
 
+        try:
+            base_path.mkdir(exist_ok=True)
+            (base_path / "backups").mkdir(exist_ok=True)
         except Exception:
             base_path = Path.home() / ".fm26_mod_manager"
             base_path.mkdir(exist_ok=True)
-            self.config_file = base_path / "config.json"
-            self.backup_dir = base_path / "backups"
-            self.backup_dir.mkdir(exist_ok=True)
+            (base_path / "backups").mkdir(exist_ok=True)
+
+        self._storage_base = base_path
+        self.config_file = base_path / "config.json"
+        self.backup_dir = base_path / "backups"
 
     def _load_config(self):
         """Load configuration and update paths if needed."""
@@ -106,7 +144,21 @@ class FM26ModManagerApp:
             self.mod_manager.mods = mods
 
     def _save_config(self):
-        """Persist configuration to disk."""
+        """
+        Schedule a config write, coalescing changes made in quick succession.
+
+        The write is scheduled by the first change and not pushed back by
+        later ones, so it always lands within SAVE_DELAY_MS of that change.
+        """
+        if self._save_pending is None:
+            self._save_pending = self.root.after(SAVE_DELAY_MS, self._flush_config)
+
+    def _flush_config(self):
+        """Persist configuration to disk now, cancelling any scheduled write."""
+        if self._save_pending is not None:
+            self.root.after_cancel(self._save_pending)
+            self._save_pending = None
+
         # Update current profile's mods
         self.profile_manager.set_current_profile_mods(self.mod_manager.mods)
 
@@ -118,11 +170,19 @@ class FM26ModManagerApp:
         if not success and hasattr(self, 'status_bar'):
             self.status_bar.show("Warning: Failed to save configuration", "warning")
 
+    @property
+    def busy(self) -> bool:
+        """Whether a background file operation is running."""
+        return self._busy
+
+    def shutdown(self):
+        """Write any pending configuration and stop the worker before the window is destroyed."""
+        if self._save_pending is not None:
+            self._flush_config()
+        self._worker.shutdown(wait=False, cancel_futures=True)
+
     def _create_ui(self):
         """Build the modern user interface."""
-        style = ttk.Style()
-        apply_dark_theme(style)
-
         header_frame = ttk.Frame(self.root)
         header_frame.pack(fill=tk.X, padx=30, pady=(25, 15))
 
@@ -263,55 +323,25 @@ class FM26ModManagerApp:
         button_frame = ttk.Frame(self.root)
         button_frame.pack(fill=tk.X, padx=30, pady=(0, 20))
 
-        # Left-aligned buttons
-        ActionButton(
-            button_frame,
-            "Add Mod",
-            self._add_mod,
-            style='primary',
-            icon="+"
-        ).pack(side=tk.LEFT, padx=(0, 10))
-
-        ActionButton(
-            button_frame,
-            "Restore All",
-            self._restore_all,
-            style='secondary',
-            icon="↺"
-        ).pack(side=tk.LEFT, padx=(0, 10))
-
-        ActionButton(
-            button_frame,
-            "Launch Game",
-            self._launch_game,
-            style='success',
-            icon="▶"
-        ).pack(side=tk.LEFT)
-
-        # Right-aligned mod control buttons
-        ActionButton(
-            button_frame,
-            "Remove",
-            self._remove_mod,
-            style='danger',
-            icon="×"
-        ).pack(side=tk.RIGHT)
-
-        ActionButton(
-            button_frame,
-            "Disable",
-            self._disable_mod,
-            style='secondary',
-            icon="○"
-        ).pack(side=tk.RIGHT, padx=(0, 8))
+        # (text, command, style, icon, side, padx); right-aligned buttons are
+        # listed from the window edge inwards
+        buttons = (
+            ("Add Mod", self._add_mod, 'primary', "+", tk.LEFT, (0, 10)),
+            ("Restore All", self._restore_all, 'secondary', "↺", tk.LEFT, (0, 10)),
+            ("Launch Game", self._launch_game, 'success', "▶", tk.LEFT, 0),
+            ("Remove", self._remove_mod, 'danger', "×", tk.RIGHT, 0),
+            ("Disable", self._disable_mod, 'secondary', "○", tk.RIGHT, (0, 8)),
+            ("Enable", self._enable_mod, 'success', "✓", tk.RIGHT, (0, 8)),
+        )
 
-        ActionButton(
-            button_frame,
-            "Enable",
-            self._enable_mod,
-            style='success',
-            icon="✓"
-        ).pack(side=tk.RIGHT, padx=(0, 8))
+        for text, command, style, icon, side, padx in buttons:
+            ActionButton(
+                button_frame,
+                text,
+                command,
+                style=style,
+                icon=icon
+            ).pack(side=side, padx=padx)
 
     def _create_mod_list(self):
         """Create modern mod list display."""
@@ -366,25 +396,18 @@ class FM26ModManagerApp:
         # Get dropped files
         files = event.data
 
-        # Handle different formats (Windows vs Unix)
+        # Drop data is a Tcl list; paths containing spaces are wrapped in
+        # braces ({C:/My Mods/a.zip} C:/b.zip), which splitlist unwraps
         if isinstance(files, str):
-            # Windows: space-separated paths, possibly with braces
-            if files.startswith('{'):
-                # Multiple files with braces: {file1} {file2}
-                import re
-                file_list = re.findall(r'\{([^}]+)\}', files)
-            else:
-                # Single file or space-separated
-                file_list = [files.strip()]
+            file_list = self.root.tk.splitlist(files)
         else:
-            file_list = list(files)
+            file_list = files
 
         # Filter for zip/rar files
-        valid_files = []
-        for file_path in file_list:
-            file_path = file_path.strip()
-            if file_path.lower().endswith(('.zip', '.rar')):
-                valid_files.append(file_path)
+        valid_files = [
+            file_path for file_path in (f.strip() for f in file_list)
+            if file_path.lower().endswith(MOD_ARCHIVE_EXTENSIONS)
+        ]
 
         if not valid_files:
             self.logger.warning("No valid mod archives in dropped files")
@@ -392,9 +415,8 @@ class FM26ModManagerApp:
                 "Please drop ZIP or RAR mod archive files.")
             return event.action
 
-        # Process each valid file
-        for file_path in valid_files:
-            self._add_mod_from_file(file_path)
+        # Process each valid file in turn
+        self._queue_mod_files(valid_files)
 
         return event.action
 
@@ -409,7 +431,7 @@ class FM26ModManagerApp:
             )
             return False
 
-        if not Path(self.data_path).exists():
+        if not self.path_manager.get_data_path(self.fm_root_path):
             self.logger.error("FM26 data path not found")
             show_error(self.root,
                 "Installation Error",
@@ -420,8 +442,124 @@ class FM26ModManagerApp:
 
         return True
 
+    def _ensure_idle(self) -> bool:
+        """Reject new operations while a background operation is running."""
+        if self._busy:
+            self.logger.warning("Please wait for the current operation to finish")
+            return False
+        return True
+
+    def _run_in_background(self, task: Callable, on_done: Callable, status_message: str):
+        """
+        Run a file operation on the worker thread.
+
+        Args:
+            task: Callable executed on the worker thread; must not touch Tk widgets
+            on_done: Callback invoked on the Tk thread with the task's return value
+            status_message: Status bar text shown while the task runs
+        """
+        self._busy = True
+        self.status_bar.show(status_message, "info")
+        self.status_bar.start_progress()
+
+        future = self._worker.submit(task)
+        self.root.after(50, self._poll_background, future, on_done)
+
+    def _poll_background(self, future, on_done: Callable):
+        """Wait for a background task without blocking the event loop."""
+        self._show_progress_updates()
+
+        if not future.done():
+            self.root.after(50, self._poll_background, future, on_done)
+            return
+
+        self.status_bar.stop_progress()
+
+        try:
+            on_done(future.result())
+        except Exception as e:
+            self.logger.error(f"Background operation failed: {str(e)}")
+            show_error(self.root, "Error", f"An unexpected error occurred:\n\n{str(e)}")
+        finally:
+            self._busy = False
+            self._add_next_queued_mod()
+
+    def _report_progress(self, message: str):
+        """
+        Post a status update from the worker thread.
+
+        Args:
+            message: Status bar text
+        """
+        self._progress_queue.put(message)
+
+    def _show_progress_updates(self):
+        """Show status updates posted by the worker (Tk thread)."""
+        while True:
+            try:
+                message = self._progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            self.logger.info(message)
+
+    def _queue_mod_files(self, file_paths: list):
+        """Queue mod archives to be added one after another."""
+        self._pending_mod_files.extend(file_paths)
+        if len(self._pending_mod_files) > 1 and self._batch_reports is None:
+            self._batch_reports = []
+        self._add_next_queued_mod()
+
+    def _add_next_queued_mod(self):
+        """Start adding the next queued archive if no operation is running."""
+        # Dialogs shown while adding run a nested event loop, so guard against
+        # a second drop re-entering here before the current file is handled
+        if self._draining_mod_queue:
+            return
+
+        self._draining_mod_queue = True
+        try:
+            while self._pending_mod_files and not self._busy:
+                self._add_mod_from_file(self._pending_mod_files.pop(0))
+
+            if not self._pending_mod_files and not self._busy and self._batch_reports is not None:
+                reports, self._batch_reports = self._batch_reports, None
+                self._show_batch_summary(reports)
+        finally:
+            self._draining_mod_queue = False
+
+    def _show_batch_summary(self, reports: list):
+        """
+        Show one dialog for all the mods added from a multi-file drop.
+
+        Args:
+            reports: List of (mod_name, file_count, conflicts) tuples
+        """
+        if not reports:
+            return
+
+        added = "\n".join(f"  • {name} ({count} file(s))" for name, count, _ in reports)
+        message = f"Added {len(reports)} mod(s):\n\n{added}\n\nStatus: Disabled"
+
+        conflicting = [(name, conflicts) for name, _, conflicts in reports if conflicts]
+        if not conflicting:
+            show_info(self.root, "Success", message)
+            return
+
+        conflict_list = "\n".join(
+            f"  • {name}: " + ", ".join(f"{file} (used by '{mod}')" for file, mod in conflicts.items())
+            for name, conflicts in conflicting
+        )
+        show_warning(self.root,
+            "Conflicts Detected",
+            f"{message}\n\nThese mods conflict with enabled mods:\n\n{conflict_list}\n\n"
+            "You'll need to disable conflicting mods to enable them."
+        )
+
     def _browse_installation(self):
         """Handle installation folder selection."""
+        if not self._ensure_idle():
+            return
+
         self.logger.debug("Opening installation folder browser")
         initial_dir = self.fm_root_path if self.fm_root_path else None
 
@@ -434,9 +572,40 @@ class FM26ModManagerApp:
             self.logger.debug("Installation folder selection cancelled")
             return
 
+        self.logger.info(f"Validating installation path: {path}")
+        self.path_manager.clear_cache()
+        self._run_in_background(
+            lambda: self._check_installation(path),
+            self._on_installation_checked,
+            "Validating installation folder..."
+        )
+
+    def _check_installation(self, path: str) -> tuple:
+        """
+        Validate a selected folder and prepare its backup manager (worker thread).
+
+        Args:
+            path: Folder chosen by the user
+
+        Returns:
+            Tuple of (is_valid, corrected_path, backup_manager, error_message)
+        """
+        is_valid, corrected_path, error_msg = self.path_manager.validate_folder_selection(path)
+        if not is_valid:
+            return False, None, None, error_msg
+
+        data_path = self.path_manager.get_data_path(corrected_path)
+        return True, corrected_path, BackupManager(self.backup_dir, data_path), None
+
+    def _on_installation_checked(self, result: tuple):
+        """
+        Switch to a newly selected installation once it has been validated.
+
+        Args:
+            result: Return value of _check_installation
+        """
         try:
-            self.logger.info(f"Validating installation path: {path}")
-            is_valid, corrected_path, error_msg = self.path_manager.validate_folder_selection(path)
+            is_valid, corrected_path, backup_manager, error_msg = result
 
             if not is_valid:
                 self.logger.error(f"Invalid installation path: {error_msg}")
@@ -444,9 +613,11 @@ class FM26ModManagerApp:
                 return
 
             self.fm_root_path = corrected_path
-            self.data_path = self.path_manager.get_data_path(corrected_path)
+            self.data_path = str(backup_manager.data_path)
 
-            self.backup_manager = BackupManager(self.backup_dir, self.data_path)
+            # Backups stay beside the config and mod storage opened at startup,
+            # which is where the next launch looks for them
+            self.backup_manager = backup_manager
             self._setup_storage()
 
             self.path_var.set(corrected_path)
@@ -469,49 +640,106 @@ class FM26ModManagerApp:
         if old_profile == new_profile:
             return
 
+        if not self._ensure_idle():
+            self.profile_var.set(old_profile)
+            return
+
+        self._switch_profile(new_profile)
+
+    def _switch_profile(self, new_profile: str, profiles: Optional[list] = None):
+        """
+        Make another profile current and swap its mods into the game.
+
+        The previous profile's enabled mods are restored in one batch and the
+        new profile's enabled mods are backed up and copied in one batch on
+        the worker thread.
+
+        Args:
+            new_profile: Name of the profile to switch to
+            profiles: Updated profile list from the profile dialog, if any
+        """
+        old_profile = self.profile_manager.current_profile
         self.logger.info(f"Switching profile from '{old_profile}' to '{new_profile}'")
 
         # Save current profile's mods before switching
         self.profile_manager.set_current_profile_mods(self.mod_manager.mods)
+        old_enabled = self.mod_manager.get_enabled_mods()
 
-        # Disable all enabled mods in current profile
-        if self._validate_paths() and self.backup_manager:
-            enabled_mods = [m for m in self.mod_manager.mods if m['enabled']]
-            if enabled_mods:
-                # Restore all files for currently enabled mods
-                all_files = []
-                for mod in enabled_mods:
-                    all_files.extend(mod['files'])
-
-                if all_files:
-                    self.backup_manager.restore_files(all_files)
-
-        # Switch to new profile
+        if profiles is not None:
+            self.profile_manager.profiles = profiles
         self.profile_manager.current_profile = new_profile
 
         # Load new profile's mods
         current = self.profile_manager.get_profile(new_profile)
-        if current:
-            self.mod_manager.mods = current['mods']
-        else:
-            self.mod_manager.mods = []
-
-        # Enable all mods that should be enabled in new profile
-        if self._validate_paths() and self.backup_manager:
-            enabled_mods = [m for m in self.mod_manager.mods if m['enabled']]
-            for mod in enabled_mods:
-                # Backup and enable each mod
-                self.backup_manager.backup_files(mod['files'])
-                self.mod_manager.enable_mod(mod, Path(self.data_path))
+        self.mod_manager.mods = current['mods'] if current else []
+        new_enabled = self.mod_manager.get_enabled_mods()
 
         # Update UI
+        self.profile_var.set(new_profile)
+        self.profile_combo['values'] = self.profile_manager.get_profile_names()
         self._refresh_mod_list()
         self._save_config()
 
+        if not (old_enabled or new_enabled) or not (self._validate_paths() and self.backup_manager):
+            self.logger.success(f"Successfully switched to profile '{new_profile}'")
+            return
+
+        data_path = self.data_path
+        self._run_in_background(
+            lambda: self._swap_profile_files(old_enabled, new_enabled, data_path),
+            lambda errors: self._on_profile_switched(new_profile, errors),
+            f"Switching to profile '{new_profile}'..."
+        )
+
+    def _swap_profile_files(self, old_mods: list, new_mods: list, data_path: str) -> list:
+        """
+        Restore the old profile's files and install the new profile's (worker thread).
+
+        Args:
+            old_mods: Enabled mods of the previous profile
+            new_mods: Enabled mods of the new profile
+            data_path: Path to game data folder
+
+        Returns:
+            List of error messages
+        """
+        errors = []
+
+        # dict.fromkeys drops files listed by more than one mod, keeping order
+        old_files = list(dict.fromkeys(f for mod in old_mods for f in mod['files']))
+        if old_files:
+            self._report_progress(f"Restoring {len(old_files)} original file(s)...")
+            _, _, failed_restores = self.backup_manager.restore_files(old_files)
+            errors.extend(f"Restore failed: {f}" for f in failed_restores)
+
+        new_files = list(dict.fromkeys(f for mod in new_mods for f in mod['files']))
+        if new_files:
+            self._report_progress(f"Backing up {len(new_files)} original file(s)...")
+            _, failed_backups = self.backup_manager.backup_files(new_files)
+            errors.extend(f"Backup failed: {f}" for f in failed_backups)
+
+            self._report_progress(f"Copying {len(new_files)} file(s) for {len(new_mods)} mod(s)...")
+            errors.extend(self.mod_manager.enable_mods(new_mods, data_path))
+
+        return errors
+
+    def _on_profile_switched(self, new_profile: str, errors: list):
+        """
+        Finish a profile switch once the game files have been swapped.
+
+        Args:
+            new_profile: Name of the profile switched to
+            errors: Return value of _swap_profile_files
+        """
+        for error in errors:
+            self.logger.warning(error)
         self.logger.success(f"Successfully switched to profile '{new_profile}'")
 
     def _manage_profiles(self):
         """Handle profile management dialog."""
+        if not self._ensure_idle():
+            return
+
         self.logger.debug("Opening profile management dialog")
         result = show_profile_dialog(
             self.root,
@@ -528,48 +756,7 @@ class FM26ModManagerApp:
         new_profile = result['selected_profile']
 
         if old_profile != new_profile:
-            self.logger.info(f"Switching profile from '{old_profile}' to '{new_profile}'")
-            # Save current profile's mods before switching
-            self.profile_manager.set_current_profile_mods(self.mod_manager.mods)
-
-            # Disable all enabled mods in current profile
-            if self._validate_paths() and self.backup_manager:
-                enabled_mods = [m for m in self.mod_manager.mods if m['enabled']]
-                if enabled_mods:
-                    # Restore all files for currently enabled mods
-                    all_files = []
-                    for mod in enabled_mods:
-                        all_files.extend(mod['files'])
-
-                    if all_files:
-                        self.backup_manager.restore_files(all_files)
-
-            # Switch to new profile
-            self.profile_manager.profiles = result['profiles']
-            self.profile_manager.current_profile = new_profile
-
-            # Load new profile's mods
-            current = self.profile_manager.get_profile(new_profile)
-            if current:
-                self.mod_manager.mods = current['mods']
-            else:
-                self.mod_manager.mods = []
-
-            # Enable all mods that should be enabled in new profile
-            if self._validate_paths() and self.backup_manager:
-                enabled_mods = [m for m in self.mod_manager.mods if m['enabled']]
-                for mod in enabled_mods:
-                    # Backup and enable each mod
-                    self.backup_manager.backup_files(mod['files'])
-                    self.mod_manager.enable_mod(mod, Path(self.data_path))
-
-            # Update UI
-            self.profile_var.set(new_profile)
-            self.profile_combo['values'] = self.profile_manager.get_profile_names()
-            self._refresh_mod_list()
-            self._save_config()
-
-            self.logger.success(f"Successfully switched to profile '{new_profile}'")
+            self._switch_profile(new_profile, result['profiles'])
         else:
             # Just update profiles list (renames, deletions, etc.)
             self.logger.debug("Profile list updated (no switch)")
@@ -579,6 +766,9 @@ class FM26ModManagerApp:
 
     def _launch_game(self):
         """Launch Football Manager 26."""
+        if not self._ensure_idle():
+            return
+
         self.logger.info("Attempting to launch FM26")
         if not self.fm_root_path:
             self.logger.error("Cannot launch game: No FM26 installation configured")
@@ -599,52 +789,77 @@ class FM26ModManagerApp:
             )
             return
 
+        system = self.path_manager.system
+        if system == "Windows":
+            # On Windows, use shell=False and pass the path directly
+            self.logger.info(f"Launching game (Windows): {exe_path}")
+            command, cwd = [exe_path], self.fm_root_path
+        elif system == "Darwin":
+            # On macOS, use 'open' command to launch the .app bundle
+            self.logger.info(f"Launching game (macOS): {exe_path}")
+            command, cwd = ['open', exe_path], None
+        else:
+            self.logger.error(f"Unsupported platform: {system}")
+            show_error(self.root,
+                "Unsupported Platform",
+                "Game launching is only supported on Windows and macOS."
+            )
+            return
+
+        # Process creation waits for the executable to be loaded, which can
+        # take a moment on a cold disk, so it runs on the worker
+        self._run_in_background(
+            lambda: self._start_game(command, cwd),
+            self._on_game_started,
+            "Launching game..."
+        )
+
+    @staticmethod
+    def _start_game(command: list, cwd: Optional[str]) -> Optional[Exception]:
+        """
+        Start the game process without waiting for it (worker thread).
+
+        Args:
+            command: Executable and arguments
+            cwd: Working directory for the game, or None
+
+        Returns:
+            None on success, or the exception raised while starting the game
+        """
+        # Only needed once the game is launched, so kept off the startup path
+        import subprocess
+
         try:
-            import subprocess
-            import platform
-
-            system = platform.system()
-
-            if system == "Windows":
-                # On Windows, use shell=False and pass the path directly
-                self.logger.info(f"Launching game (Windows): {exe_path}")
-                subprocess.Popen([exe_path], cwd=str(Path(self.fm_root_path)))
-            elif system == "Darwin":
-                # On macOS, use 'open' command to launch the .app bundle
-                self.logger.info(f"Launching game (macOS): {exe_path}")
-                subprocess.Popen(['open', exe_path])
-            else:
-                self.logger.error(f"Unsupported platform: {system}")
-                show_error(self.root,
-                    "Unsupported Platform",
-                    "Game launching is only supported on Windows and macOS."
-                )
-                return
+            subprocess.Popen(command, cwd=cwd, close_fds=True)
+            return None
+        except Exception as e:
+            return e
 
+    def _on_game_started(self, error: Optional[Exception]):
+        """
+        Report the outcome of launching the game.
+
+        Args:
+            error: Return value of _start_game
+        """
+        if error is None:
             self.logger.success("Game launched successfully")
+            return
 
-        except Exception as e:
-            self.logger.error(f"Failed to launch game: {str(e)}")
-            show_error(self.root,
-                "Launch Failed",
-                f"An error occurred while launching the game:\n\n{str(e)}"
-            )
+        self.logger.error(f"Failed to launch game: {str(error)}")
+        show_error(self.root,
+            "Launch Failed",
+            f"An error occurred while launching the game:\n\n{str(error)}"
+        )
 
     def _add_mod(self):
         """Handle mod addition workflow via file browser."""
-        if not self._validate_paths():
+        if not self._ensure_idle() or not self._validate_paths():
             return
 
-        filetypes = [
-            ("Archive files", "*.zip *.rar *.7z"),
-            ("ZIP files", "*.zip"),
-            ("RAR files", "*.rar"),
-            ("All files", "*.*")
-        ]
-
         self.logger.debug("Opening mod archive file browser")
-        file_path = filedialog.askopenfilename(title="Select Mod Archive", filetypes=filetypes)
-        if not file_path or not Path(file_path).exists():
+        file_path = filedialog.askopenfilename(title="Select Mod Archive", filetypes=ARCHIVE_FILETYPES)
+        if not file_path:
             self.logger.debug("Mod archive selection cancelled")
             return
 
@@ -661,21 +876,28 @@ class FM26ModManagerApp:
             return
 
         # Validate file exists and is a supported format
-        if not Path(file_path).exists():
+        path = Path(file_path)
+        if not path.exists():
             self.logger.error(f"File not found: {file_path}")
             show_error(self.root, "File Not Found", f"The file does not exist:\n\n{file_path}")
             return
 
-        if not file_path.lower().endswith(('.zip', '.rar')):
+        if not path.name.lower().endswith(MOD_ARCHIVE_EXTENSIONS):
             self.logger.error(f"Unsupported file format: {file_path}")
             show_error(self.root, "Unsupported Format",
                 "Only ZIP and RAR archives are supported.\n\n"
                 "Please provide a .zip or .rar file.")
             return
 
+        # Reject archives without mod files before asking for a name
+        _, error_msg = self.mod_manager.list_bundles(file_path)
+        if error_msg:
+            self.logger.error(f"Invalid mod archive {file_path}: {error_msg.splitlines()[0]}")
+            show_error(self.root, "Invalid Archive", error_msg)
+            return
+
         # Ask for mod name
-        mod_name = ask_string(self.root, "Mod Name", "Enter a name for this mod:", Path(file_path).stem
-        )
+        mod_name = ask_string(self.root, "Mod Name", "Enter a name for this mod:", path.stem)
 
         if not mod_name:
             self.logger.debug("Mod name input cancelled")
@@ -688,12 +910,40 @@ class FM26ModManagerApp:
             return
 
         self.logger.info(f"Adding mod '{mod_name}' from {file_path}")
+        self.logger.info(f"Extracting '{mod_name}'...")
 
-        temp_dir = self.backup_dir / "temp_extract"
-        try:
-            self.logger.info(f"Extracting '{mod_name}'...")
+        self._run_in_background(
+            lambda: self._extract_mod(file_path, mod_name),
+            lambda result: self._on_mod_extracted(mod_name, result),
+            f"Extracting '{mod_name}'..."
+        )
+
+    def _extract_mod(self, file_path: str, mod_name: str) -> tuple:
+        """
+        Extract a mod archive and build its metadata entry (worker thread).
 
-            success, bundle_files, error_msg, traceback_str = self.mod_manager.extract_mod(file_path, mod_name, temp_dir)
+        Args:
+            file_path: Path to the mod archive file
+            mod_name: Name of the mod being added
+
+        Returns:
+            Tuple of (extract_mod result, mod metadata or None on failure)
+        """
+        result = self.mod_manager.extract_mod(file_path, mod_name)
+        success, bundle_files, _, _ = result
+        mod_data = self.mod_manager.create_mod_entry(mod_name, bundle_files) if success else None
+        return result, mod_data
+
+    def _on_mod_extracted(self, mod_name: str, result: tuple):
+        """
+        Finish adding a mod once its archive has been extracted.
+
+        Args:
+            mod_name: Name of the mod being added
+            result: Return value of _extract_mod
+        """
+        try:
+            (success, bundle_files, error_msg, traceback_str), mod_data = result
             if not success:
                 self.logger.error(f"Extraction failed: {error_msg}")
                 show_error(self.root, "Extraction Failed", error_msg, traceback_str)
@@ -702,26 +952,26 @@ class FM26ModManagerApp:
             conflicts = self.mod_manager.check_conflicts([f.name for f in bundle_files])
             if conflicts:
                 self.logger.warning(f"Mod '{mod_name}' has conflicts with existing mods")
-                conflict_msg = "The following files conflict with enabled mods:\n\n"
-                for file, mod in conflicts.items():
-                    conflict_msg += f"  • {file} (used by '{mod}')\n"
-                conflict_msg += "\nThe mod will be added but you'll need to disable conflicting mods to enable it."
-                show_warning(self.root, "Conflicts Detected", conflict_msg)
-
-            self.logger.info(f"Installing '{mod_name}'...")
-
-            success, error_msg = self.mod_manager.install_mod(mod_name, bundle_files)
-            if not success:
-                self.logger.error(f"Installation failed: {error_msg}")
-                show_error(self.root, "Installation Failed", f"Failed to install mod:\n\n{error_msg}")
-                return
 
-            mod_data = self.mod_manager.create_mod_entry(mod_name, bundle_files)
-            self.mod_manager.mods.append(mod_data)
+            self.mod_manager.add_mod_entry(mod_data)
             self._save_config()
             self._refresh_mod_list()
 
             self.logger.success(f"Mod '{mod_name}' added successfully with {len(bundle_files)} file(s)")
+
+            # Mods from a multi-file drop are reported together once the queue is empty
+            if self._batch_reports is not None:
+                self._batch_reports.append((mod_name, len(bundle_files), conflicts))
+                return
+
+            if conflicts:
+                conflict_list = "\n".join(f"  • {file} (used by '{mod}')" for file, mod in conflicts.items())
+                conflict_msg = (
+                    f"The following files conflict with enabled mods:\n\n{conflict_list}\n\n"
+                    "The mod will be added but you'll need to disable conflicting mods to enable it."
+                )
+                show_warning(self.root, "Conflicts Detected", conflict_msg)
+
             show_info(self.root,
                 "Success",
                 f"Mod '{mod_name}' added successfully!\n\n"
@@ -736,17 +986,9 @@ class FM26ModManagerApp:
                 f"An error occurred while adding the mod:\n\n{str(e)}"
             )
 
-        finally:
-            if temp_dir.exists():
-                try:
-                    import shutil
-                    shutil.rmtree(temp_dir)
-                except Exception:
-                    pass
-
     def _enable_mod(self):
         """Handle mod enabling workflow."""
-        if not self._validate_paths():
+        if not self._ensure_idle() or not self._validate_paths():
             return
 
         mod_name = self.mod_tree.get_selection()
@@ -771,7 +1013,7 @@ class FM26ModManagerApp:
             conflicts = self.mod_manager.check_conflicts(mod['files'])
             if conflicts:
                 self.logger.error(f"Cannot enable '{mod_name}' due to conflicts")
-                conflict_list = "\n".join([f"  • {file} (used by '{mod_name}')" for file, mod_name in conflicts.items()])
+                conflict_list = "\n".join(f"  • {file} (used by '{mod_name}')" for file, mod_name in conflicts.items())
                 show_error(self.root,
                     "Conflicts Detected",
                     f"Cannot enable mod due to file conflicts:\n\n{conflict_list}\n\n"
@@ -781,46 +1023,84 @@ class FM26ModManagerApp:
 
             self.logger.info(f"Enabling '{mod_name}'...")
 
-            backed_up, failed = self.backup_manager.backup_files(mod['files'])
-            if failed:
-                self.logger.error(f"Backup failed for {len(failed)} file(s)")
-                show_error(self.root,
-                    "Backup Failed",
-                    f"Failed to backup some files:\n\n" +
-                    "\n".join([f"  • {f}" for f in failed])
-                )
-                return
+            data_path = self.data_path
+            self._run_in_background(
+                lambda: self._install_mod_files(mod, data_path),
+                lambda result: self._on_mod_enabled(mod, result),
+                f"Enabling '{mod_name}'..."
+            )
 
-            if backed_up > 0:
-                self.logger.info(f"Backed up {backed_up} file(s) before modification")
+        except Exception as e:
+            self.logger.error(f"Unexpected error while enabling mod: {str(e)}")
+            show_error(self.root, "Error", f"An unexpected error occurred:\n\n{str(e)}")
 
-            success, copied_files, error_msg = self.mod_manager.enable_mod(mod, Path(self.data_path))
+    def _install_mod_files(self, mod: dict, data_path: str) -> tuple:
+        """
+        Back up original files and copy mod files into the game (worker thread).
 
-            if not success:
-                self.logger.error(f"Failed to enable mod, rolling back: {error_msg}")
-                if copied_files:
-                    self.backup_manager.restore_files(copied_files)
+        Rolls back any partially copied files if enabling fails.
 
-                show_error(self.root,
-                    "Enable Failed",
-                    f"Failed to enable mod:\n\n{error_msg}\n\n"
-                    "Any partial changes have been rolled back."
-                )
-                return
+        Args:
+            mod: Mod metadata dictionary
+            data_path: Path to game data folder
 
-            mod['enabled'] = True
-            self._save_config()
-            self._refresh_mod_list()
-            self.logger.success(f"Mod '{mod_name}' enabled successfully")
-            show_info(self.root, "Success", f"Mod '{mod_name}' has been enabled successfully!")
+        Returns:
+            Tuple of (backed_up_count, failed_backups, success, error_message)
+        """
+        self._report_progress(f"Backing up original files for '{mod['name']}'...")
+        backed_up, failed = self.backup_manager.backup_files(mod['files'])
+        if failed:
+            return backed_up, failed, False, None
 
-        except Exception as e:
-            self.logger.error(f"Unexpected error while enabling mod: {str(e)}")
-            show_error(self.root, "Error", f"An unexpected error occurred:\n\n{str(e)}")
+        self._report_progress(f"Copying {len(mod['files'])} file(s) for '{mod['name']}'...")
+        success, copied_files, error_msg = self.mod_manager.enable_mod(mod, data_path)
+        if not success and copied_files:
+            self._report_progress(f"Rolling back '{mod['name']}'...")
+            self.backup_manager.restore_files(copied_files)
+
+        return backed_up, [], success, error_msg
+
+    def _on_mod_enabled(self, mod: dict, result: tuple):
+        """
+        Finish enabling a mod once its files have been copied.
+
+        Args:
+            mod: Mod metadata dictionary
+            result: Return value of _install_mod_files
+        """
+        mod_name = mod['name']
+        backed_up, failed, success, error_msg = result
+
+        if failed:
+            self.logger.error(f"Backup failed for {len(failed)} file(s)")
+            show_error(self.root,
+                "Backup Failed",
+                f"Failed to backup some files:\n\n" +
+                "\n".join(f"  • {f}" for f in failed)
+            )
+            return
+
+        if backed_up > 0:
+            self.logger.info(f"Backed up {backed_up} file(s) before modification")
+
+        if not success:
+            self.logger.error(f"Failed to enable mod, rolled back: {error_msg}")
+            show_error(self.root,
+                "Enable Failed",
+                f"Failed to enable mod:\n\n{error_msg}\n\n"
+                "Any partial changes have been rolled back."
+            )
+            return
+
+        self.mod_manager.set_mod_enabled(mod, True)
+        self._save_config()
+        self._refresh_mod_list()
+        self.logger.success(f"Mod '{mod_name}' enabled successfully")
+        show_info(self.root, "Success", f"Mod '{mod_name}' has been enabled successfully!")
 
     def _disable_mod(self):
         """Handle mod disabling workflow."""
-        if not self._validate_paths():
+        if not self._ensure_idle() or not self._validate_paths():
             return
 
         mod_name = self.mod_tree.get_selection()
@@ -844,32 +1124,50 @@ class FM26ModManagerApp:
 
             self.logger.info(f"Disabling '{mod_name}'...")
 
-            success, missing, failed = self.backup_manager.restore_files(mod['files'])
-            if not success:
-                error_msg = ""
-                if missing:
-                    error_msg += "Missing backup files:\n" + "\n".join([f"  • {f}" for f in missing])
-                if failed:
-                    if error_msg:
-                        error_msg += "\n\n"
-                    error_msg += "Failed to restore:\n" + "\n".join([f"  • {f}" for f in failed])
-
-                self.logger.error(f"Failed to restore original files for '{mod_name}'")
-                show_error(self.root, "Restore Failed", error_msg)
-                return
-
-            mod['enabled'] = False
-            self._save_config()
-            self._refresh_mod_list()
-            self.logger.success(f"Mod '{mod_name}' disabled successfully")
-            show_info(self.root, "Success", f"Mod '{mod_name}' has been disabled successfully!")
+            self._run_in_background(
+                lambda: self.backup_manager.restore_files(mod['files']),
+                lambda result: self._on_mod_disabled(mod, result),
+                f"Disabling '{mod_name}'..."
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to disable mod: {str(e)}")
             show_error(self.root, "Error", f"Failed to disable mod:\n\n{str(e)}")
 
+    def _on_mod_disabled(self, mod: dict, result: tuple):
+        """
+        Finish disabling a mod once its original files have been restored.
+
+        Args:
+            mod: Mod metadata dictionary
+            result: Return value of BackupManager.restore_files
+        """
+        mod_name = mod['name']
+        success, missing, failed = result
+
+        if not success:
+            sections = []
+            if missing:
+                sections.append("Missing backup files:\n" + "\n".join(f"  • {f}" for f in missing))
+            if failed:
+                sections.append("Failed to restore:\n" + "\n".join(f"  • {f}" for f in failed))
+            error_msg = "\n\n".join(sections)
+
+            self.logger.error(f"Failed to restore original files for '{mod_name}'")
+            show_error(self.root, "Restore Failed", error_msg)
+            return
+
+        self.mod_manager.set_mod_enabled(mod, False)
+        self._save_config()
+        self._refresh_mod_list()
+        self.logger.success(f"Mod '{mod_name}' disabled successfully")
+        show_info(self.root, "Success", f"Mod '{mod_name}' has been disabled successfully!")
+
     def _remove_mod(self):
         """Handle mod removal workflow."""
+        if not self._ensure_idle():
+            return
+
         mod_name = self.mod_tree.get_selection()
         if not mod_name:
             self.logger.warning("No mod selected for removal")
@@ -890,28 +1188,50 @@ class FM26ModManagerApp:
                 return
 
             self.logger.info(f"Removing '{mod_name}'...")
-
-            if mod['enabled'] and self.backup_manager:
-                self.backup_manager.restore_files(mod['files'])
-
-            self.mod_manager.remove_mod_files(mod_name)
-            self.mod_manager.mods.remove(mod)
-            self._save_config()
-            self._refresh_mod_list()
-
-            self.logger.success(f"Mod '{mod_name}' removed successfully")
-            show_info(self.root, "Success", f"Mod '{mod_name}' has been removed successfully!")
+            self._run_in_background(
+                lambda: self._delete_mod_files(mod),
+                lambda result: self._on_mod_removed(mod),
+                f"Removing '{mod_name}'..."
+            )
 
         except Exception as e:
             self.logger.error(f"Failed to remove mod: {str(e)}")
             show_error(self.root, "Error", f"Failed to remove mod:\n\n{str(e)}")
 
+    def _delete_mod_files(self, mod: dict):
+        """
+        Restore originals for an enabled mod and delete its stored files (worker thread).
+
+        Args:
+            mod: Mod metadata dictionary
+        """
+        if mod['enabled'] and self.backup_manager:
+            self.backup_manager.restore_files(mod['files'])
+
+        self.mod_manager.remove_mod_files(mod['name'])
+
+    def _on_mod_removed(self, mod: dict):
+        """
+        Drop a mod from the list once its files have been deleted.
+
+        Args:
+            mod: Mod metadata dictionary
+        """
+        mod_name = mod['name']
+        self.mod_manager.remove_mod_entry(mod)
+        self._save_config()
+        self._refresh_mod_list()
+
+        self.logger.success(f"Mod '{mod_name}' removed successfully")
+        show_info(self.root, "Success", f"Mod '{mod_name}' has been removed successfully!")
+
     def _restore_all(self):
         """Handle restore all workflow."""
-        if not self._validate_paths() or not self.backup_manager:
+        if not self._ensure_idle() or not self._validate_paths() or not self.backup_manager:
             return
 
-        if not self.backup_manager.has_backups():
+        backup_count = self.backup_manager.get_backup_count()
+        if not backup_count:
             self.logger.warning("No backups found to restore")
             show_info(self.root,
                 "No Backups Found",
@@ -921,7 +1241,6 @@ class FM26ModManagerApp:
             )
             return
 
-        backup_count = self.backup_manager.get_backup_count()
         enabled_mods = self.mod_manager.get_enabled_mods()
 
         if not ask_yes_no(self.root,
@@ -933,13 +1252,26 @@ class FM26ModManagerApp:
             self.logger.debug("Restore all cancelled")
             return
 
-        try:
-            self.logger.info("Restoring original files...")
+        self.logger.info("Restoring original files...")
+        self._run_in_background(
+            self.backup_manager.restore_all,
+            lambda result: self._on_restore_all_done(backup_count, result),
+            f"Restoring {backup_count} original file(s)..."
+        )
 
-            restored, failed = self.backup_manager.restore_all()
+    def _on_restore_all_done(self, backup_count: int, result: tuple):
+        """
+        Finish restoring once the backup copies are done.
+
+        Args:
+            backup_count: Number of backed up files being restored
+            result: Return value of BackupManager.restore_all
+        """
+        try:
+            restored, failed = result
 
             for mod in self.mod_manager.mods:
-                mod['enabled'] = False
+                self.mod_manager.set_mod_enabled(mod, False)
 
             self._save_config()
             self._refresh_mod_list()
@@ -949,7 +1281,7 @@ class FM26ModManagerApp:
                 show_warning(self.root,
                     "Restore Completed with Errors",
                     f"Restored {restored} of {backup_count} files.\n\n"
-                    f"Failed to restore:\n" + "\n".join([f"  • {f}" for f in failed])
+                    f"Failed to restore:\n" + "\n".join(f"  • {f}" for f in failed)
                 )
             else:
                 self.logger.success(f"Restored {restored} original file(s)")
@@ -975,6 +1307,4 @@ class FM26ModManagerApp:
 
     def _refresh_mod_list(self):
         """Update mod list display."""
-        self.mod_tree.clear()
-        for mod in self.mod_manager.mods:
-            self.mod_tree.add_mod(mod)
+        self.mod_tree.set_mods(self.mod_manager.mods)
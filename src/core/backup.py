@@ -1,7 +1,9 @@
-import shutil
+import os
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+from .file_ops import copy_files, scan_bundles, scan_files
+
 
 class BackupManager:
     """Manages selective backup and restore of original game files."""
@@ -32,26 +34,31 @@ class BackupManager:
         Returns:
             Tuple of (backed_up_count, failed_files_list)
         """
-        backed_up = 0
+        to_copy = []
         failed_files = []
 
+        # One directory read each instead of two stat calls per file
+        sources = scan_files(self.data_path)
+        backups = scan_files(self.original_backup_dir)
+        backup_dir = str(self.original_backup_dir)
+
         for file_name in file_names:
-            source = self.data_path / file_name
-            dest = self.original_backup_dir / file_name
+            key = file_name.casefold()
 
-            if dest.exists():
+            if key in backups or key not in sources:
                 continue
 
-            if not source.exists():
-                continue
+            # Marking it as backed up also skips duplicate names, so two
+            # workers never write the same destination
+            backups[key] = sources[key]
+            to_copy.append((file_name, sources[key], os.path.join(backup_dir, file_name)))
 
-            try:
-                shutil.copy2(source, dest)
-                backed_up += 1
-            except Exception as e:
-                failed_files.append(f"{file_name} ({str(e)})")
+        errors = copy_files([(source, dest) for _, source, dest in to_copy])
+        for (file_name, _, _), error in zip(to_copy, errors):
+            if error is not None:
+                failed_files.append(f"{file_name} ({str(error)})")
 
-        return backed_up, failed_files
+        return len(to_copy) - len(failed_files), failed_files
 
     def restore_files(self, file_names: List[str]) -> Tuple[bool, List[str], List[str]]:
         """
@@ -65,19 +72,28 @@ class BackupManager:
         """
         missing_backups = []
         failed_restores = []
+        to_copy = []
+        seen = set()
+
+        backups = scan_files(self.original_backup_dir)
+        data_dir = str(self.data_path)
 
         for file_name in file_names:
-            backup_file = self.original_backup_dir / file_name
+            key = file_name.casefold()
+            if key in seen:
+                continue
+            seen.add(key)
 
-            if not backup_file.exists():
+            if key not in backups:
                 missing_backups.append(file_name)
                 continue
 
-            try:
-                dest = self.data_path / file_name
-                shutil.copy2(backup_file, dest)
-            except Exception as e:
-                failed_restores.append(f"{file_name} ({str(e)})")
+            to_copy.append((file_name, backups[key], os.path.join(data_dir, file_name)))
+
+        errors = copy_files([(source, dest) for _, source, dest in to_copy])
+        for (file_name, _, _), error in zip(to_copy, errors):
+            if error is not None:
+                failed_restores.append(f"{file_name} ({str(error)})")
 
         success = len(missing_backups) == 0 and len(failed_restores) == 0
         return success, missing_backups, failed_restores
@@ -89,23 +105,28 @@ class BackupManager:
         Returns:
             Tuple of (restored_count, failed_files_list)
         """
-        restored = 0
+        backup_files = scan_bundles(self.original_backup_dir)
+        data_dir = str(self.data_path)
         failed_files = []
 
-        for backup_file in self.original_backup_dir.glob("*.bundle"):
-            try:
-                dest = self.data_path / backup_file.name
-                shutil.copy2(backup_file, dest)
-                restored += 1
-            except Exception as e:
-                failed_files.append(f"{backup_file.name} ({str(e)})")
+        errors = copy_files([(path, os.path.join(data_dir, name)) for name, path in backup_files])
+        for (name, _), error in zip(backup_files, errors):
+            if error is not None:
+                failed_files.append(f"{name} ({str(error)})")
 
-        return restored, failed_files
+        return len(backup_files) - len(failed_files), failed_files
 
     def get_backup_count(self) -> int:
         """Get count of backed up files."""
-        return len(list(self.original_backup_dir.glob("*.bundle")))
+        return len(scan_bundles(self.original_backup_dir))
 
     def has_backups(self) -> bool:
-        """Check if any backups exist."""
-        return self.original_backup_dir.exists() and self.get_backup_count() > 0
+        """Check if any backups exist, stopping at the first one found."""
+        try:
+            with os.scandir(self.original_backup_dir) as entries:
+                return any(
+                    entry.name.lower().endswith('.bundle') and entry.is_file()
+                    for entry in entries
+                )
+        except (FileNotFoundError, NotADirectoryError):
+            return False
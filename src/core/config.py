@@ -1,8 +1,24 @@
-import json
-import shutil
+import os
 from pathlib import Path
 from typing import List, Dict, Optional
 
+try:
+    import orjson
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    _loads = orjson.loads
+    _DecodeError = orjson.JSONDecodeError
+except ImportError:
+    import json
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+    _loads = json.loads
+    _DecodeError = json.JSONDecodeError
+
 
 class ConfigManager:
     """Manages persistent configuration with atomic writes."""
@@ -16,6 +32,8 @@ class ConfigManager:
         """
         self.config_file = Path(config_file)
         self.config_file.parent.mkdir(parents=True, exist_ok=True)
+        # Serialized config last read from or written to disk
+        self._last_saved: Optional[bytes] = None
 
     def load(self) -> tuple[Optional[str], List[Dict], List[Dict], str]:
         """
@@ -28,8 +46,10 @@ class ConfigManager:
             return None, [], [{'name': 'Default', 'mods': []}], 'Default'
 
         try:
-            with open(self.config_file, 'r') as f:
-                data = json.load(f)
+            with open(self.config_file, 'rb') as f:
+                raw = f.read()
+                data = _loads(raw)
+                self._last_saved = raw
                 fm_root_path = data.get('fm_root_path')
 
                 # Handle old config format (pre-profiles)
@@ -44,7 +64,7 @@ class ConfigManager:
 
                 return fm_root_path, mods, profiles, current_profile
 
-        except (json.JSONDecodeError, Exception):
+        except (_DecodeError, Exception):
             return None, [], [{'name': 'Default', 'mods': []}], 'Default'
 
     def save(self, fm_root_path: Optional[str], profiles: List[Dict], current_profile: str) -> bool:
@@ -52,6 +72,7 @@ class ConfigManager:
         Save configuration with atomic write.
 
         Uses temp file + rename for atomic operation to prevent corruption.
+        Nothing is written if the config on disk already holds the same data.
 
         Args:
             fm_root_path: Path to FM26 root folder
@@ -68,12 +89,16 @@ class ConfigManager:
                 'current_profile': current_profile
             }
 
+            payload = _dumps(data)
+            if payload == self._last_saved and self.config_file.exists():
+                return True
+
             temp_file = self.config_file.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(temp_file, 'wb') as f:
+                f.write(payload)
 
-            if temp_file.exists():
-                shutil.move(str(temp_file), str(self.config_file))
+            os.replace(temp_file, self.config_file)
+            self._last_saved = payload
 
             return True
 
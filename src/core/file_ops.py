@@ -0,0 +1,251 @@
+"""Low-level file copy helpers shared by the core managers."""
+import functools
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Callable, Dict, List, Optional, Tuple
+
+# Bundle files are typically several MB, so archive members are streamed and
+# files hashed in 1 MiB chunks to cut the number of read/write calls per file.
+COPY_BUFFER_SIZE = 1 << 20
+MAX_COPY_WORKERS = 8
+
+_local = threading.local()
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_buffer() -> memoryview:
+    """Return this thread's reusable copy buffer."""
+    buffer = getattr(_local, 'buffer', None)
+    if buffer is None:
+        buffer = _local.buffer = memoryview(bytearray(COPY_BUFFER_SIZE))
+    return buffer
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Return the shared copy thread pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=MAX_COPY_WORKERS, thread_name_prefix='file-copy')
+        return _pool
+
+
+@functools.lru_cache(maxsize=None)
+def _load_clonefile():
+    """
+    Look up macOS's clonefile(2) on first use.
+
+    Returns:
+        The clonefile C function, or None on other platforms
+    """
+    if sys.platform != 'darwin':
+        return None
+
+    try:
+        import ctypes
+        clonefile = ctypes.CDLL(None, use_errno=True).clonefile
+    except (OSError, AttributeError):
+        return None
+
+    clonefile.argtypes = (ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32)
+    clonefile.restype = ctypes.c_int
+    return clonefile
+
+
+def copy_stream(src: BinaryIO, dst: BinaryIO, digest=None) -> None:
+    """
+    Copy an open binary stream into another using the shared copy buffer.
+
+    Args:
+        src: Readable binary file object
+        dst: Writable binary file object
+        digest: Optional hashlib object updated with every chunk copied
+    """
+    readinto = getattr(src, 'readinto', None)
+
+    if readinto is None:
+        if digest is None:
+            shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+            return
+        while True:
+            chunk = src.read(COPY_BUFFER_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+            dst.write(chunk)
+        return
+
+    buffer = _get_buffer()
+    while True:
+        size = readinto(buffer)
+        if not size:
+            break
+        chunk = buffer[:size]
+        if digest is not None:
+            digest.update(chunk)
+        dst.write(chunk)
+
+
+def copy_file(src, dst) -> None:
+    """
+    Copy file contents and metadata (equivalent to shutil.copy2).
+
+    On APFS the copy is a copy-on-write clone, so backing up a game file
+    costs no data writes until one of the two files changes. Otherwise
+    shutil.copy2 picks the fastest copy the platform offers.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    clonefile = _load_clonefile()
+    if clonefile is not None and clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+        shutil.copystat(src, dst)
+        return
+
+    shutil.copy2(src, dst)
+
+
+def run_parallel(func: Callable, items: list) -> list:
+    """
+    Call func on every item using the shared I/O thread pool.
+
+    Every call runs to completion even if others fail, so no work is still
+    writing files when the caller handles an error.
+
+    Args:
+        func: Callable taking one item
+        items: Items to process
+
+    Returns:
+        List aligned with items holding each call's return value, or the
+        exception it raised
+    """
+    def _call(item):
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+
+    if len(items) <= 1:
+        return [_call(item) for item in items]
+
+    return list(_get_pool().map(_call, items))
+
+
+def copy_files(pairs: List[Tuple[str, str]]) -> List[Optional[Exception]]:
+    """
+    Copy several files concurrently.
+
+    File copies are I/O-bound and release the GIL while reading and writing,
+    so a small thread pool keeps the disk queue busy for multi-bundle mods.
+
+    Args:
+        pairs: List of (source, destination) paths
+
+    Returns:
+        List aligned with pairs holding None on success or the raised exception
+    """
+    return run_parallel(lambda pair: copy_file(*pair), pairs)
+
+
+def scan_files(directory) -> Dict[str, str]:
+    """
+    List the files in a directory with a single scandir pass.
+
+    Keys are case-folded so lookups match the case-insensitive file systems
+    used on Windows and macOS, where Path.exists() ignores case.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        Dictionary mapping case-folded file name to full file path, empty if
+        the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name.casefold(): entry.path for entry in entries if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def hash_file(path) -> str:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex-encoded digest
+    """
+    import hashlib
+
+    with open(path, 'rb', buffering=0) as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+        digest = hashlib.sha256()
+        buffer = _get_buffer()
+        while True:
+            size = f.readinto(buffer)
+            if not size:
+                break
+            digest.update(buffer[:size])
+        return digest.hexdigest()
+
+
+def is_same_file(src, dst, expected_hash: Optional[str] = None) -> bool:
+    """
+    Check whether dst already holds the contents of src.
+
+    Files copied with copy_file keep the source's modification time, so a
+    matching size and mtime means dst is an earlier copy of src and no data
+    needs to be read. When only the size matches, dst is hashed and compared
+    against expected_hash if one is known.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+        expected_hash: SHA-256 hex digest of src, if known
+
+    Returns:
+        True if dst exists and matches src
+    """
+    try:
+        dst_stat = os.stat(dst)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+    src_stat = os.stat(src)
+    if src_stat.st_size != dst_stat.st_size:
+        return False
+    if src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+        return True
+    return expected_hash is not None and hash_file(dst) == expected_hash
+
+
+def scan_bundles(directory) -> List[Tuple[str, str]]:
+    """
+    List the .bundle files in a directory with a single scandir pass.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        List of (file name, full path) tuples, empty if the directory does
+        not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                (entry.name, entry.path) for entry in entries
+                if entry.name.lower().endswith('.bundle') and entry.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
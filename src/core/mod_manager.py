@@ -1,11 +1,77 @@
+import functools
+import os
 import shutil
-import zipfile
-import rarfile
+import sys
 import traceback
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
+from .file_ops import copy_files, copy_stream, hash_file, is_same_file, run_parallel
+
+
+UNSUPPORTED_ARCHIVE_MSG = "Only ZIP and RAR archives are supported."
+
+NO_BUNDLES_MSG = (
+    "No .bundle files found in the archive.\n\n"
+    "Please ensure the archive contains FM26 mod files."
+)
+
+RAR_TOOL_MISSING_MSG = (
+    "RAR extraction tool not found.\n\n"
+    "To extract RAR files, please install:\n\n"
+    "Windows: Download and install WinRAR from https://www.win-rar.com/\n"
+    "macOS: Run 'brew install unrar' in Terminal\n\n"
+    "Alternatively, extract the RAR file manually and create a ZIP archive instead."
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_rarfile():
+    """
+    Import rarfile and point it at the unrar executable.
+
+    Deferred until a RAR archive is actually opened, since importing rarfile
+    and probing for WinRAR/unrar adds to startup time for no benefit when
+    only ZIP mods are used.
+    """
+    import platform
+    import rarfile
+
+    system = platform.system()
+
+    if system == "Windows":
+        possible_paths = [
+            r"C:\Program Files\WinRAR\UnRAR.exe",
+            r"C:\Program Files (x86)\WinRAR\UnRAR.exe",
+            os.path.join(os.environ.get('PROGRAMFILES', ''), 'WinRAR', 'UnRAR.exe'),
+            os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), 'WinRAR', 'UnRAR.exe'),
+        ]
+
+        for path in possible_paths:
+            if os.path.exists(path):
+                rarfile.UNRAR_TOOL = path
+                return rarfile
+
+        rarfile.UNRAR_TOOL = "unrar"
+
+    elif system == "Darwin":
+        homebrew_path = "/opt/homebrew/bin/unrar"
+        if os.path.exists(homebrew_path):
+            rarfile.UNRAR_TOOL = homebrew_path
+        else:
+            rarfile.UNRAR_TOOL = "unrar"
+    else:
+        rarfile.UNRAR_TOOL = "unrar"
+
+    return rarfile
+
+
+def _is_missing_unrar(error: Exception) -> bool:
+    """Check whether an error means the unrar tool could not be run."""
+    rarfile = sys.modules.get('rarfile')
+    return rarfile is not None and isinstance(error, rarfile.RarCannotExec)
+
 
 class ModManager:
     """Manages mod installation, tracking, and conflict detection."""
@@ -19,118 +85,233 @@ class ModManager:
         """
         self.mod_storage_dir = Path(mod_storage_dir)
         self.mod_storage_dir.mkdir(parents=True, exist_ok=True)
-        self.mods: List[Dict] = []
-        self._setup_rar_tool()
-
-    def _setup_rar_tool(self):
-        """Configure rarfile library to find unrar executable."""
-        import platform
-        import os
-
-        system = platform.system()
-
-        if system == "Windows":
-            possible_paths = [
-                r"C:\Program Files\WinRAR\UnRAR.exe",
-                r"C:\Program Files (x86)\WinRAR\UnRAR.exe",
-                os.path.join(os.environ.get('PROGRAMFILES', ''), 'WinRAR', 'UnRAR.exe'),
-                os.path.join(os.environ.get('PROGRAMFILES(X86)', ''), 'WinRAR', 'UnRAR.exe'),
-            ]
-
-            for path in possible_paths:
-                if os.path.exists(path):
-                    rarfile.UNRAR_TOOL = path
-                    return
-
-            rarfile.UNRAR_TOOL = "unrar"
+        self._enabled_file_index: Dict[str, str] = {}
+        self._mods_by_name: Dict[str, Dict] = {}
+        self._enabled_mods: Dict[str, Dict] = {}
+        # Digests computed while extracting, consumed by create_mod_entry
+        self._extracted_hashes: Dict[str, str] = {}
+        self.mods = []
+
+    @property
+    def mods(self) -> List[Dict]:
+        """Mods in the current profile."""
+        return self._mods
+
+    @mods.setter
+    def mods(self, mods: List[Dict]) -> None:
+        self._mods = mods
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the lookup tables derived from the mod list."""
+        self._enabled_file_index = {}
+        self._mods_by_name = {mod['name']: mod for mod in self._mods}
+        self._enabled_mods = {mod['name']: mod for mod in self._mods if mod.get('enabled')}
+        for mod in self._enabled_mods.values():
+            for file_name in mod.get('files', []):
+                self._enabled_file_index[file_name] = mod['name']
+
+    def add_mod_entry(self, mod: Dict) -> None:
+        """Add a mod metadata entry to the current mod list."""
+        self._mods.append(mod)
+        self._mods_by_name[mod['name']] = mod
+        if mod.get('enabled'):
+            self._enabled_mods[mod['name']] = mod
+            for file_name in mod.get('files', []):
+                self._enabled_file_index[file_name] = mod['name']
+
+    def remove_mod_entry(self, mod: Dict) -> None:
+        """Remove a mod metadata entry from the current mod list."""
+        self._mods.remove(mod)
+        self._mods_by_name.pop(mod['name'], None)
+        self._enabled_mods.pop(mod['name'], None)
+        self._drop_enabled_files(mod)
+
+    def set_mod_enabled(self, mod: Dict, enabled: bool) -> None:
+        """
+        Update a mod's enabled flag and the enabled-mod and enabled-file indexes.
 
-        elif system == "Darwin":
-            homebrew_path = "/opt/homebrew/bin/unrar"
-            if os.path.exists(homebrew_path):
-                rarfile.UNRAR_TOOL = homebrew_path
-            else:
-                rarfile.UNRAR_TOOL = "unrar"
+        Args:
+            mod: Mod metadata dictionary
+            enabled: New enabled state
+        """
+        mod['enabled'] = enabled
+        if enabled:
+            self._enabled_mods[mod['name']] = mod
+            for file_name in mod.get('files', []):
+                self._enabled_file_index[file_name] = mod['name']
         else:
-            rarfile.UNRAR_TOOL = "unrar"
+            self._enabled_mods.pop(mod['name'], None)
+            self._drop_enabled_files(mod)
 
-    def extract_mod(self, archive_path: str, mod_name: str, temp_dir: Path) -> Tuple[bool, Optional[List[Path]], Optional[str], Optional[str]]:
+    def _drop_enabled_files(self, mod: Dict) -> None:
+        """Remove a mod's files from the enabled-file index."""
+        for file_name in mod.get('files', []):
+            if self._enabled_file_index.get(file_name) == mod['name']:
+                del self._enabled_file_index[file_name]
+
+    def extract_mod(self, archive_path: str, mod_name: str) -> Tuple[bool, Optional[List[Path]], Optional[str], Optional[str]]:
         """
-        Extract mod archive and find bundle files.
+        Stream bundle files from a mod archive straight into mod storage.
+
+        Only archive members ending in .bundle are read, and each one is written
+        once to its final location, so no temporary extraction directory is needed.
 
         Args:
             archive_path: Path to mod archive file
             mod_name: Name for this mod
-            temp_dir: Temporary extraction directory
 
         Returns:
             Tuple of (success, bundle_files_list, error_message, traceback_str)
         """
+        mod_storage = self.mod_storage_dir / mod_name
+
         try:
-            if temp_dir.exists():
-                shutil.rmtree(temp_dir)
-            temp_dir.mkdir(exist_ok=True)
-
-            if archive_path.endswith('.zip'):
-                with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_dir)
-            elif archive_path.endswith('.rar'):
-                try:
-                    with rarfile.RarFile(archive_path, 'r') as rar_ref:
-                        rar_ref.extractall(temp_dir)
-                except rarfile.RarCannotExec as e:
-                    error_msg = (
-                        "RAR extraction tool not found.\n\n"
-                        "To extract RAR files, please install:\n\n"
-                        "Windows: Download and install WinRAR from https://www.win-rar.com/\n"
-                        "macOS: Run 'brew install unrar' in Terminal\n\n"
-                        "Alternatively, extract the RAR file manually and create a ZIP archive instead."
+            archive = self._open_archive(archive_path)
+            if archive is None:
+                return False, None, UNSUPPORTED_ARCHIVE_MSG, None
+
+            with archive:
+                members = self._bundle_members(archive)
+                if not members:
+                    return False, None, NO_BUNDLES_MSG, None
+
+                if mod_storage.exists():
+                    shutil.rmtree(mod_storage)
+                mod_storage.mkdir(parents=True, exist_ok=True)
+
+                # Members sharing a file name overwrite each other, so only
+                # the last one is extracted. Names are case-folded to match
+                # the case-insensitive file systems used on Windows and macOS,
+                # so two workers never write the same destination
+                latest = {os.path.basename(info.filename).casefold(): info.filename for info in members}
+                storage_dir = str(mod_storage)
+                targets = {
+                    os.path.join(storage_dir, os.path.basename(member_name)): member_name
+                    for member_name in latest.values()
+                }
+
+                if archive_path.endswith('.rar'):
+                    # Every unrar process decompresses a solid archive from
+                    # the start, so RAR members are read one after another
+                    # from this handle rather than concurrently
+                    hashes = {
+                        dest: self._write_member(archive, member_name, dest)
+                        for dest, member_name in targets.items()
+                    }
+                else:
+                    # Each ZIP member is decompressed on its own thread with
+                    # its own archive handle; zlib works outside the GIL
+                    results = run_parallel(
+                        functools.partial(self._extract_member, archive_path), list(targets.items())
                     )
-                    return False, None, error_msg, traceback.format_exc()
-            else:
-                return False, None, "Only ZIP and RAR archives are supported.", None
-
-            bundle_files = list(temp_dir.rglob("*.bundle"))
-
-            if not bundle_files:
-                return False, None, (
-                    "No .bundle files found in the archive.\n\n"
-                    "Please ensure the archive contains FM26 mod files."
-                ), None
+                    for result in results:
+                        if isinstance(result, Exception):
+                            raise result
+                    hashes = dict(zip(targets, results))
 
+            bundle_files = [Path(dest) for dest in targets]
+            self._extracted_hashes.update(hashes)
             return True, bundle_files, None, None
 
         except Exception as e:
+            shutil.rmtree(mod_storage, ignore_errors=True)
+            if _is_missing_unrar(e):
+                return False, None, RAR_TOOL_MISSING_MSG, traceback.format_exc()
             return False, None, f"Could not extract the archive:\n\n{str(e)}", traceback.format_exc()
 
-    def install_mod(self, mod_name: str, bundle_files: List[Path]) -> Tuple[bool, Optional[str]]:
+    def list_bundles(self, archive_path: str) -> Tuple[Optional[List[str]], Optional[str]]:
         """
-        Copy mod files to permanent storage.
+        List the bundle files in a mod archive without extracting anything.
+
+        Only the archive's index is read, so an archive without mod files is
+        rejected before any data is decompressed.
 
         Args:
-            mod_name: Name of the mod
-            bundle_files: List of extracted bundle file paths
+            archive_path: Path to mod archive file
 
         Returns:
-            Tuple of (success, error_message)
+            Tuple of (bundle_file_names, error_message)
         """
         try:
-            mod_storage = self.mod_storage_dir / mod_name
-            if mod_storage.exists():
-                shutil.rmtree(mod_storage)
-            mod_storage.mkdir(parents=True, exist_ok=True)
-
-            for bundle_file in bundle_files:
-                shutil.copy2(bundle_file, mod_storage / bundle_file.name)
+            archive = self._open_archive(archive_path)
+            if archive is None:
+                return None, UNSUPPORTED_ARCHIVE_MSG
 
-            return True, None
+            with archive:
+                names = [os.path.basename(info.filename) for info in self._bundle_members(archive)]
 
         except Exception as e:
-            return False, str(e)
+            if _is_missing_unrar(e):
+                return None, RAR_TOOL_MISSING_MSG
+            return None, f"Could not read the archive:\n\n{str(e)}"
+
+        if not names:
+            return None, NO_BUNDLES_MSG
+        return names, None
+
+    @classmethod
+    def _extract_member(cls, archive_path: str, target: Tuple[str, str]) -> str:
+        """
+        Extract one archive member to a file using its own archive handle.
+
+        Args:
+            archive_path: Path to mod archive file
+            target: Tuple of (destination path, member name)
+
+        Returns:
+            SHA-256 hex digest of the extracted data
+        """
+        dest, member_name = target
+        with cls._open_archive(archive_path) as archive:
+            return cls._write_member(archive, member_name, dest)
+
+    @staticmethod
+    def _write_member(archive, member_name: str, dest: str) -> str:
+        """
+        Write one member of an open archive to a file.
+
+        Args:
+            archive: Open ZIP or RAR archive
+            member_name: Name of the member to extract
+            dest: Destination file path
+
+        Returns:
+            SHA-256 hex digest of the extracted data
+        """
+        import hashlib
+
+        digest = hashlib.sha256()
+        with archive.open(member_name) as src, open(dest, 'wb') as dst:
+            copy_stream(src, dst, digest)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _open_archive(archive_path: str):
+        """Open a ZIP or RAR archive, returning None for other formats."""
+        if archive_path.endswith('.zip'):
+            import zipfile
+            return zipfile.ZipFile(archive_path, 'r')
+        if archive_path.endswith('.rar'):
+            return _load_rarfile().RarFile(archive_path, 'r')
+        return None
+
+    @staticmethod
+    def _bundle_members(archive) -> list:
+        """Return the archive entries that are .bundle files."""
+        return [
+            info for info in archive.infolist()
+            if not info.is_dir() and info.filename.lower().endswith('.bundle')
+        ]
 
     def create_mod_entry(self, mod_name: str, bundle_files: List[Path]) -> Dict:
         """
         Create mod metadata entry.
 
+        Records a SHA-256 digest of each stored bundle so enable_mod can tell
+        when the game already has the mod's version of a file. Digests taken
+        during extract_mod are reused; other files are hashed here.
+
         Args:
             mod_name: Name of the mod
             bundle_files: List of bundle files
@@ -138,13 +319,23 @@ class ModManager:
         Returns:
             Mod metadata dictionary
         """
-        mod_storage = self.mod_storage_dir / mod_name
+        mod_storage = os.path.join(self.mod_storage_dir, mod_name)
+
+        files = []
+        file_paths = {}
+        hashes = {}
+        for f in bundle_files:
+            stored = os.path.join(mod_storage, f.name)
+            files.append(f.name)
+            file_paths[f.name] = stored
+            hashes[f.name] = self._extracted_hashes.pop(stored, None) or hash_file(stored)
 
         return {
             'name': mod_name,
             'enabled': False,
-            'files': [f.name for f in bundle_files],
-            'file_paths': {f.name: str(mod_storage / f.name) for f in bundle_files},
+            'files': files,
+            'file_paths': file_paths,
+            'hashes': hashes,
             'added_date': datetime.now().isoformat()
         }
 
@@ -158,15 +349,10 @@ class ModManager:
         Returns:
             Dictionary mapping conflicting files to mod names
         """
-        conflicts = {}
-        for mod in self.mods:
-            if mod['enabled']:
-                for file_name in file_names:
-                    if file_name in mod['files']:
-                        conflicts[file_name] = mod['name']
-        return conflicts
+        index = self._enabled_file_index
+        return {file_name: index[file_name] for file_name in file_names if file_name in index}
 
-    def enable_mod(self, mod: Dict, data_path: Path) -> Tuple[bool, List[str], Optional[str]]:
+    def enable_mod(self, mod: Dict, data_path: str) -> Tuple[bool, List[str], Optional[str]]:
         """
         Copy mod files to game directory.
 
@@ -177,21 +363,89 @@ class ModManager:
         Returns:
             Tuple of (success, copied_files_list, error_message)
         """
-        copied_files = []
-
         try:
             for file_name, file_path in mod['file_paths'].items():
-                if not Path(file_path).exists():
-                    return False, copied_files, f"Mod file missing: {file_name}"
+                if not os.path.exists(file_path):
+                    return False, [], f"Mod file missing: {file_name}"
 
-                dest = data_path / file_name
-                shutil.copy2(file_path, dest)
-                copied_files.append(file_name)
+            copied_files, failures = self._install_files(
+                mod['file_paths'], mod.get('hashes', {}), data_path
+            )
+            if failures:
+                return False, copied_files, "\n".join(failures)
 
             return True, copied_files, None
 
         except Exception as e:
-            return False, copied_files, str(e)
+            return False, [], str(e)
+
+    def enable_mods(self, mods: List[Dict], data_path: str) -> List[str]:
+        """
+        Copy the files of several mods to the game directory in one batch.
+
+        Mods with missing stored files are skipped. When two mods provide the
+        same file, the later mod in the list wins.
+
+        Args:
+            mods: Mod metadata dictionaries
+            data_path: Path to game data folder
+
+        Returns:
+            List of error messages, empty if every mod was enabled
+        """
+        file_paths = {}
+        hashes = {}
+        errors = []
+        for mod in mods:
+            missing = [name for name, path in mod['file_paths'].items() if not os.path.exists(path)]
+            if missing:
+                errors.append(f"{mod['name']}: Mod file missing: {missing[0]}")
+                continue
+            file_paths.update(mod['file_paths'])
+            hashes.update(mod.get('hashes', {}))
+
+        try:
+            _, failures = self._install_files(file_paths, hashes, data_path)
+        except Exception as e:
+            failures = [str(e)]
+
+        return errors + failures
+
+    @staticmethod
+    def _install_files(file_paths: Dict[str, str], hashes: Dict[str, str],
+                       data_path: str) -> Tuple[List[str], List[str]]:
+        """
+        Copy stored mod files into the game directory.
+
+        Args:
+            file_paths: Mapping of file name to stored file path
+            hashes: Mapping of file name to SHA-256 digest, where known
+            data_path: Path to game data folder
+
+        Returns:
+            Tuple of (copied_files_list, failure_messages)
+        """
+        # Files the game already has from an earlier enable don't need copying
+        data_dir = str(data_path)
+        copied_files = []
+        to_copy = []
+        for file_name, file_path in file_paths.items():
+            dest = os.path.join(data_dir, file_name)
+            if is_same_file(file_path, dest, hashes.get(file_name)):
+                copied_files.append(file_name)
+            else:
+                to_copy.append((file_name, file_path, dest))
+
+        errors = copy_files([(src, dest) for _, src, dest in to_copy])
+
+        failures = []
+        for (file_name, _, _), error in zip(to_copy, errors):
+            if error is None:
+                copied_files.append(file_name)
+            else:
+                failures.append(f"{file_name}: {error}")
+
+        return copied_files, failures
 
     def validate_mod_name(self, mod_name: str) -> Optional[str]:
         """
@@ -208,14 +462,14 @@ class ModManager:
         if not mod_name:
             return "Mod name cannot be empty."
 
-        if any(m['name'] == mod_name for m in self.mods):
+        if mod_name in self._mods_by_name:
             return f"A mod named '{mod_name}' already exists.\nPlease choose a different name."
 
         return None
 
     def get_mod_by_name(self, mod_name: str) -> Optional[Dict]:
         """Get mod metadata by name."""
-        return next((m for m in self.mods if m['name'] == mod_name), None)
+        return self._mods_by_name.get(mod_name)
 
     def remove_mod_files(self, mod_name: str) -> None:
         """Delete mod files from storage."""
@@ -225,4 +479,4 @@ class ModManager:
 
     def get_enabled_mods(self) -> List[Dict]:
         """Get list of currently enabled mods."""
-        return [m for m in self.mods if m['enabled']]
+        return list(self._enabled_mods.values())
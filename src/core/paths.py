@@ -1,13 +1,28 @@
-import platform
+import os
+import sys
+import time
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+# How long a data folder lookup is trusted before the disk is checked again
+DATA_PATH_CACHE_TTL = 2.0
+
+# platform.system() names keyed by sys.platform. Using sys.platform avoids
+# importing platform at startup, which pulls in subprocess and on Windows
+# can spawn "cmd /c ver" to read the OS version
+_SYSTEM_NAMES = {'win32': 'Windows', 'darwin': 'Darwin'}
 
 
 class PathManager:
     """Manages FM26 installation paths across different operating systems."""
 
     def __init__(self):
-        self.system = platform.system()
+        self.system = _SYSTEM_NAMES.get(sys.platform, sys.platform.capitalize())
+        self._data_path_cache: Dict[Tuple[str, str], Tuple[float, Optional[str]]] = {}
+
+    def clear_cache(self) -> None:
+        """Forget cached data folder lookups, e.g. after the user picks a new folder."""
+        self._data_path_cache.clear()
 
     def detect_installation(self) -> Optional[str]:
         """
@@ -18,20 +33,25 @@ class PathManager:
         """
         if self.system == "Windows":
             possible_roots = [
-                Path("C:/Program Files (x86)/Steam/steamapps/common/Football Manager 26"),
-                Path("D:/SteamLibrary/steamapps/common/Football Manager 26"),
-                Path("E:/SteamLibrary/steamapps/common/Football Manager 26"),
+                "C:/Program Files (x86)/Steam/steamapps/common/Football Manager 26",
+                "D:/SteamLibrary/steamapps/common/Football Manager 26",
+                "E:/SteamLibrary/steamapps/common/Football Manager 26",
             ]
         elif self.system == "Darwin":  # macOS
             possible_roots = [
-                Path.home() / "Library/Application Support/Steam/steamapps/common/Football Manager 26"
+                os.path.join(os.path.expanduser("~"), "Library/Application Support/Steam/steamapps/common/Football Manager 26")
             ]
         else:
             return None
 
         for root in possible_roots:
-            if root.exists() and self.validate_installation(root):
-                return str(root)
+            # Skip absent drives before probing deep paths on them
+            drive = os.path.splitdrive(root)[0]
+            if drive and not os.path.isdir(drive + os.sep):
+                continue
+
+            if os.path.isdir(root) and self.validate_installation(root):
+                return str(Path(root))
         return None
 
     def validate_installation(self, fm_root: Optional[str]) -> bool:
@@ -48,15 +68,7 @@ class PathManager:
             return False
 
         try:
-            root_path = Path(fm_root)
-            if not root_path.exists():
-                return False
-
-            data_path = self.get_data_path(fm_root)
-            if not data_path:
-                return False
-
-            return Path(data_path).exists() and Path(data_path).is_dir()
+            return self.get_data_path(fm_root) is not None
 
         except Exception:
             return False
@@ -68,12 +80,27 @@ class PathManager:
         Args:
             fm_root: Path to FM26 root folder
 
+        Lookups are cached for DATA_PATH_CACHE_TTL seconds, since the same
+        folder is checked several times at startup and before every action.
+
         Returns:
             Path to StandalonePlatform folder containing .bundle files
         """
         if not fm_root:
             return None
 
+        key = (self.system, str(fm_root))
+        now = time.monotonic()
+        cached = self._data_path_cache.get(key)
+        if cached and now - cached[0] < DATA_PATH_CACHE_TTL:
+            return cached[1]
+
+        data_path = self._find_data_path(fm_root)
+        self._data_path_cache[key] = (now, data_path)
+        return data_path
+
+    def _find_data_path(self, fm_root: str) -> Optional[str]:
+        """Build the data folder path and check it exists on disk."""
         try:
             root_path = Path(fm_root)
 
@@ -84,7 +111,7 @@ class PathManager:
             else:
                 return None
 
-            return str(data_path) if data_path.exists() else None
+            return str(data_path) if data_path.is_dir() else None
 
         except Exception:
             return None
@@ -7,9 +7,20 @@ class ProfileManager:
 
     def __init__(self):
         """Initialize profile manager."""
-        self.profiles: List[Dict] = []
+        self._profile_names: Optional[List[str]] = None
+        self.profiles = []
         self.current_profile: str = "Default"
 
+    @property
+    def profiles(self) -> List[Dict]:
+        """All profiles, each with a name and its own mod list."""
+        return self._profiles
+
+    @profiles.setter
+    def profiles(self, profiles: List[Dict]) -> None:
+        self._profiles = profiles
+        self._profile_names = None
+
     def create_profile(self, name: str) -> bool:
         """
         Create a new profile.
@@ -27,6 +38,7 @@ class ProfileManager:
             'name': name,
             'mods': []  # Each profile has its own mod list with enabled states
         })
+        self._profile_names = None
         return True
 
     def delete_profile(self, name: str) -> bool:
@@ -47,6 +59,7 @@ class ProfileManager:
             return False
 
         self.profiles.remove(profile)
+        self._profile_names = None
         return True
 
     def get_profile(self, name: str) -> Optional[Dict]:
@@ -54,8 +67,15 @@ class ProfileManager:
         return next((p for p in self.profiles if p['name'] == name), None)
 
     def get_profile_names(self) -> List[str]:
-        """Get list of all profile names."""
-        return [p['name'] for p in self.profiles]
+        """
+        Get list of all profile names.
+
+        The list is cached until profiles are added, removed, renamed or
+        replaced, so callers must not modify it.
+        """
+        if self._profile_names is None:
+            self._profile_names = [p['name'] for p in self.profiles]
+        return self._profile_names
 
     def switch_profile(self, name: str) -> bool:
         """
@@ -105,6 +125,7 @@ class ProfileManager:
             return False
 
         profile['name'] = new_name
+        self._profile_names = None
         if self.current_profile == old_name:
             self.current_profile = new_name
 
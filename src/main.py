@@ -10,7 +10,7 @@ except ImportError:
     DND_AVAILABLE = False
 
 from app import FM26ModManagerApp
-from ui.dialogs import show_error, ask_yes_no
+from ui.dialogs import show_error, show_warning, ask_yes_no
 
 
 def handle_exception(exc_type, exc_value, exc_traceback):
@@ -52,7 +52,13 @@ def main():
 
         def on_closing():
             """Handle window close event."""
+            if app.busy:
+                show_warning(root, "Operation in Progress",
+                    "Please wait for the current operation to finish before exiting.")
+                return
+
             if ask_yes_no(root, "Quit", "Are you sure you want to exit?"):
+                app.shutdown()
                 root.destroy()
 
         root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -1,8 +1,16 @@
 import tkinter as tk
+from collections import deque
+from datetime import datetime
 from tkinter import ttk, scrolledtext
-from typing import Callable
+from typing import Callable, Dict, List, Tuple
 from .styles import COLORS
 
+# Status text changes are applied at most once per frame (~60 Hz)
+STATUS_REFRESH_MS = 16
+
+# Oldest log lines are dropped from the viewer beyond this many entries
+LOG_BUFFER_LIMIT = 2000
+
 
 class StatusBar:
     """Modern status bar with icon and subtle animations."""
@@ -37,12 +45,46 @@ class StatusBar:
         )
         self.label.pack(side=tk.LEFT, padx=(0, 15))
 
+        self.progress = ttk.Progressbar(
+            self.frame,
+            mode='indeterminate',
+            length=140,
+            style='Status.Horizontal.TProgressbar'
+        )
+
+        self._pending_status = None
+        self._refresh_id = None
+
     def pack(self, **kwargs):
         """Pack the status bar frame."""
         self.frame.pack(**kwargs)
 
+    def start_progress(self):
+        """Show an indeterminate progress indicator for background work."""
+        self.progress.pack(side=tk.RIGHT, padx=15)
+        self.progress.start(15)
+
+    def stop_progress(self):
+        """Hide the progress indicator."""
+        self.progress.stop()
+        self.progress.pack_forget()
+
     def show(self, message: str, status_type: str = "info"):
-        """Update status message with icon and color coding."""
+        """
+        Update status message with icon and color coding.
+
+        Updates are coalesced: only the latest message is drawn, on the next
+        frame, so bursts of status changes cost a single redraw.
+        """
+        self._pending_status = (message, status_type)
+        if self._refresh_id is None:
+            self._refresh_id = self.frame.after(STATUS_REFRESH_MS, self._apply_status)
+
+    def _apply_status(self):
+        """Draw the most recent status message."""
+        self._refresh_id = None
+        message, status_type = self._pending_status
+
         icon_colors = {
             'info': COLORS['info'],
             'success': COLORS['success'],
@@ -55,7 +97,6 @@ class StatusBar:
 
         self.icon_label.config(fg=icon_color)
         self.label.config(text=message, fg=color)
-        self.frame.update_idletasks()
 
 
 class ActionButton:
@@ -188,17 +229,28 @@ class ModTreeView:
         self.tree.tag_configure('enabled', foreground=COLORS['success'])
         self.tree.tag_configure('disabled', foreground=COLORS['fg_secondary'])
 
+        # mod name -> (item id, displayed state), and item id -> mod name
+        self._rows: Dict[str, Tuple[str, tuple]] = {}
+        self._names: Dict[str, str] = {}
+
     def pack(self, **kwargs):
         """Pack the container."""
         self.container.pack(**kwargs)
 
     def clear(self):
         """Remove all items."""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-    def add_mod(self, mod_data: dict):
-        """Add mod to the tree."""
+        self.tree.delete(*self.tree.get_children())
+        self._rows.clear()
+        self._names.clear()
+
+    @staticmethod
+    def _state_of(mod_data: dict) -> tuple:
+        """Snapshot of the mod fields shown in its row."""
+        return mod_data['enabled'], mod_data.get('added_date', ''), tuple(mod_data['files'])
+
+    @staticmethod
+    def _row_for(mod_data: dict) -> Tuple[tuple, tuple]:
+        """Build the column values and tags displayed for a mod."""
         status = "✓ Enabled" if mod_data['enabled'] else "○ Disabled"
         files = ', '.join(mod_data['files'][:3])
         if len(mod_data['files']) > 3:
@@ -216,15 +268,66 @@ class ModTreeView:
             formatted_date = 'Unknown'
 
         tag = 'enabled' if mod_data['enabled'] else 'disabled'
-        self.tree.insert('', tk.END, values=(status, mod_data['name'], formatted_date, files), tags=(tag,))
+        return (status, mod_data['name'], formatted_date, files), (tag,)
+
+    def add_mod(self, mod_data: dict):
+        """Add mod to the tree."""
+        values, tags = self._row_for(mod_data)
+        iid = self.tree.insert('', tk.END, values=values, tags=tags)
+        self._rows[mod_data['name']] = (iid, self._state_of(mod_data))
+        self._names[iid] = mod_data['name']
+
+    def update_mod(self, mod_data: dict):
+        """Redraw an existing mod's row if anything shown in it has changed."""
+        iid, state = self._rows[mod_data['name']]
+        new_state = self._state_of(mod_data)
+        if new_state != state:
+            values, tags = self._row_for(mod_data)
+            self.tree.item(iid, values=values, tags=tags)
+            self._rows[mod_data['name']] = (iid, new_state)
+
+    def remove_mods(self, mod_names: List[str]):
+        """Remove the rows for several mods with a single Tk call."""
+        iids = []
+        for mod_name in mod_names:
+            iid = self._rows.pop(mod_name)[0]
+            del self._names[iid]
+            iids.append(iid)
+        if iids:
+            self.tree.delete(*iids)
+
+    def set_mods(self, mods: List[dict]):
+        """
+        Update the tree to show the given mods, touching only changed rows.
+
+        Rows are matched by mod name, so unchanged mods are left alone and
+        refreshing after a single enable/disable costs one item update
+        rather than rebuilding the whole list.
+
+        Args:
+            mods: Mods to display, in display order
+        """
+        desired = {mod['name']: mod for mod in mods}
+
+        self.remove_mods([name for name in self._rows if name not in desired])
+
+        for mod in mods:
+            if mod['name'] in self._rows:
+                self.update_mod(mod)
+            else:
+                self.add_mod(mod)
+
+        order = [self._rows[mod['name']][0] for mod in mods]
+        if list(self.tree.get_children()) != order:
+            for index, iid in enumerate(order):
+                self.tree.move(iid, '', index)
 
     def get_selection(self):
         """Get currently selected item."""
         selection = self.tree.selection()
         if not selection:
             return None
-        item = self.tree.item(selection[0])
-        return item['values'][1] if item['values'] else None
+        return self._names.get(selection[0])
 
 
 class ExpandableLogViewer:
@@ -239,7 +342,9 @@ class ExpandableLogViewer:
         """
         self.parent = parent
         self.expanded = False
-        self.log_buffer = []  # Store all logs with their levels
+        self.log_buffer = deque(maxlen=LOG_BUFFER_LIMIT)  # Recent logs with their levels
+        self._pending_logs = []
+        self._flush_id = None
 
         # Main container
         self.container = tk.Frame(
@@ -355,11 +460,8 @@ class ExpandableLogViewer:
         self.log_text.tag_configure('debug', foreground=COLORS['fg_secondary'])
 
         # Populate from buffer
-        self.log_text.config(state=tk.NORMAL)
-        for message, level in self.log_buffer:
-            self.log_text.insert(tk.END, message, level)
-        self.log_text.see(tk.END)  # Scroll to bottom
-        self.log_text.config(state=tk.DISABLED)
+        self._pending_logs = []
+        self._insert_logs(self.log_buffer)
 
     def _collapse(self):
         """Collapse the log viewer."""
@@ -375,6 +477,7 @@ class ExpandableLogViewer:
         """Clear the log display and call callback."""
         # Clear buffer
         self.log_buffer.clear()
+        self._pending_logs = []
 
         # Clear visible logs if expanded
         if self.log_text:
@@ -393,19 +496,48 @@ class ExpandableLogViewer:
             message: Log message
             level: Log level (info, success, warning, error, debug)
         """
-        from datetime import datetime
         timestamp = datetime.now().strftime('%H:%M:%S')
         formatted_message = f"[{timestamp}] {message}\n"
 
         # Always add to buffer
         self.log_buffer.append((formatted_message, level))
 
-        # Update visible widget if expanded
+        # Lines shown while expanded are written once per frame, so bursts of
+        # log messages cost a single insert
         if self.log_text:
-            self.log_text.config(state=tk.NORMAL)
-            self.log_text.insert(tk.END, formatted_message, level)
-            self.log_text.see(tk.END)  # Auto-scroll to bottom
-            self.log_text.config(state=tk.DISABLED)
+            self._pending_logs.append((formatted_message, level))
+            if self._flush_id is None:
+                self._flush_id = self.container.after(STATUS_REFRESH_MS, self._flush_logs)
+
+    def _flush_logs(self):
+        """Write log lines queued since the last frame."""
+        self._flush_id = None
+        pending, self._pending_logs = self._pending_logs, []
+        if self.log_text and pending:
+            self._insert_logs(pending)
+
+    def _insert_logs(self, entries):
+        """
+        Append log entries to the text widget with a single insert.
+
+        Args:
+            entries: Iterable of (formatted_message, level) tuples
+        """
+        chunks = [part for entry in entries for part in entry]
+        if not chunks:
+            return
+
+        self.log_text.config(state=tk.NORMAL)
+        self.log_text.insert(tk.END, *chunks)
+
+        # Keep the widget no longer than the buffer it mirrors
+        line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+        excess = line_count - LOG_BUFFER_LIMIT
+        if excess > 0:
+            self.log_text.delete('1.0', f'{excess + 1}.0')
+
+        self.log_text.see(tk.END)  # Auto-scroll to bottom
+        self.log_text.config(state=tk.DISABLED)
 
     def load_logs(self, log_contents: str):
         """
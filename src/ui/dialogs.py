@@ -1,3 +1,4 @@
+import copy
 import tkinter as tk
 from tkinter import scrolledtext
 from .styles import COLORS
@@ -506,7 +507,8 @@ class ProfileDialog(ModernDialog):
     def __init__(self, parent, profiles: list, current_profile: str):
         super().__init__(parent, "Manage Profiles", width=600)
 
-        self.profiles = profiles.copy()
+        # Work on copies so renames are only applied if the dialog is confirmed
+        self.profiles = copy.deepcopy(profiles)
         self.current_profile = current_profile
         self.selected_profile = current_profile
 
@@ -58,6 +58,15 @@ def apply_dark_theme(style: ttk.Style):
               foreground=[('readonly', '#c9d1d9')],
               arrowcolor=[('readonly', '#58a6ff')])
 
+    # Status bar progress indicator
+    style.configure('Status.Horizontal.TProgressbar',
+                    background='#58a6ff',
+                    troughcolor='#161b22',
+                    bordercolor='#30363d',
+                    lightcolor='#58a6ff',
+                    darkcolor='#58a6ff',
+                    thickness=6)
+
     # Combobox dropdown listbox
     style.configure('Combobox.Listbox',
                     background='#21262d',
@@ -94,3 +103,13 @@ COLORS = {
     'border': '#30363d',          # Subtle borders
     'shadow': '#010409',          # Shadows for depth
 }
+
+# Option database entries for the Combobox dropdown popup, which is a plain
+# Listbox and is not covered by the ttk style
+COMBOBOX_POPUP_OPTIONS = {
+    '*TCombobox*Listbox.background': COLORS['bg_tertiary'],
+    '*TCombobox*Listbox.foreground': COLORS['fg_primary'],
+    '*TCombobox*Listbox.selectBackground': COLORS['accent_emphasis'],
+    '*TCombobox*Listbox.selectForeground': '#ffffff',
+    '*TCombobox*Listbox.font': ('Segoe UI', 10),
+}
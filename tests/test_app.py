@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+import pytest
+
+# app.py imports its packages the way main.py runs it, from inside src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import app as app_module  # noqa: E402
+from app import FM26ModManagerApp  # noqa: E402
+from core.paths import PathManager  # noqa: E402
+
+
+class _FakeRoot:
+    """Stand-in for tk.Tk so the app can start without a display."""
+
+    def __init__(self):
+        self.scheduled = {}
+
+    def title(self, *args):
+        pass
+
+    def geometry(self, *args):
+        pass
+
+    def minsize(self, *args):
+        pass
+
+    def option_add(self, *args):
+        pass
+
+    def configure(self, **kwargs):
+        pass
+
+    def after(self, delay, callback):
+        token = len(self.scheduled)
+        self.scheduled[token] = callback
+        return token
+
+    def after_cancel(self, token):
+        self.scheduled.pop(token, None)
+
+
+class _FakeWidget:
+    """Accepts the calls the app makes on its status bar and path field."""
+
+    def show(self, *args):
+        pass
+
+    def set(self, *args):
+        pass
+
+
+class TestInstallationStorage:
+    """Test where backups live across a browse and a restart."""
+
+    @pytest.fixture
+    def env(self, tmp_path, monkeypatch):
+        """Start-up environment where auto-detection finds no installation."""
+        home = tmp_path / "home"
+        home.mkdir()
+        install = tmp_path / "FM26"
+        data = install / "data"
+        data.mkdir(parents=True)
+        (data / "ui.bundle").write_text("original")
+
+        monkeypatch.setattr(Path, 'home', classmethod(lambda cls: home))
+        monkeypatch.setattr(PathManager, 'detect_installation', lambda self: None)
+        monkeypatch.setattr(PathManager, 'validate_installation', lambda self, path: path == str(install))
+        monkeypatch.setattr(PathManager, 'validate_folder_selection', lambda self, path: (True, path, None))
+        monkeypatch.setattr(PathManager, 'get_data_path', lambda self, path: str(data))
+        monkeypatch.setattr(app_module, 'apply_dark_theme', lambda style: None)
+        monkeypatch.setattr(app_module.ttk, 'Style', lambda root: None)
+
+        def _create_ui(self):
+            self.status_bar = _FakeWidget()
+            self.path_var = _FakeWidget()
+
+        monkeypatch.setattr(FM26ModManagerApp, '_create_ui', _create_ui)
+        monkeypatch.setattr(FM26ModManagerApp, '_refresh_mod_list', lambda self: None)
+        monkeypatch.setattr(FM26ModManagerApp, '_setup_drag_drop', lambda self: None)
+        return install, data
+
+    def _start(self):
+        return FM26ModManagerApp(_FakeRoot())
+
+    def test_backups_made_after_browse_survive_restart(self, env):
+        """Originals backed up after browsing should still be found on the next launch."""
+        install, data = env
+        app = self._start()
+        app._on_installation_checked(app._check_installation(str(install)))
+        app.backup_manager.backup_files(['ui.bundle'])
+        app._flush_config()
+        app._worker.shutdown()
+
+        restarted = self._start()
+        restarted._worker.shutdown()
+
+        assert restarted.fm_root_path == str(install)
+        assert restarted.backup_manager.has_backups()
+        (data / "ui.bundle").write_text("modded")
+        restarted.backup_manager.restore_files(['ui.bundle'])
+        assert (data / "ui.bundle").read_text() == "original"
@@ -86,6 +86,19 @@ class TestBackupManager:
         assert backed_up_count == 1
         assert len(failed) == 0
 
+    def test_backup_files_duplicate_names(self, setup_dirs):
+        """Duplicate file names should only be backed up once."""
+        data_path = setup_dirs['data_path']
+        bm = setup_dirs['backup_manager']
+
+        (data_path / 'test.bundle').write_text("original content")
+
+        backed_up_count, failed = bm.backup_files(['test.bundle', 'test.bundle'])
+
+        assert backed_up_count == 1
+        assert len(failed) == 0
+        assert bm.get_backup_count() == 1
+
     def test_restore_files_success(self, setup_dirs):
         """Successfully restore backed up files."""
         data_path = setup_dirs['data_path']
@@ -1,5 +1,6 @@
 import pytest
 import json
+import os
 from pathlib import Path
 from src.core.config import ConfigManager
 
@@ -133,6 +134,18 @@ class TestConfigManager:
 
         assert config_manager.config_file.exists()
 
+    def test_unchanged_config_is_not_rewritten(self, config_manager, sample_mods):
+        """Saving the same data twice should leave the file untouched."""
+        profiles = [{'name': 'Default', 'mods': sample_mods}]
+        config_manager.save("/test/path", profiles, 'Default')
+        os.utime(config_manager.config_file, (1_600_000_000, 1_600_000_000))
+
+        assert config_manager.save("/test/path", profiles, 'Default') is True
+        assert config_manager.config_file.stat().st_mtime == 1_600_000_000
+
+        assert config_manager.save("/other/path", profiles, 'Default') is True
+        assert config_manager.config_file.stat().st_mtime != 1_600_000_000
+
     def test_config_file_format(self, config_manager, sample_mods):
         """Saved config should be properly formatted JSON."""
         fm_root = "/test/path"
@@ -0,0 +1,35 @@
+import tkinter as tk
+import pytest
+from src.core.profile_manager import ProfileManager
+from src.ui import dialogs
+from src.ui.dialogs import ProfileDialog
+
+
+class TestProfileDialog:
+    """Test profile dialog edits stay local until confirmed."""
+
+    @pytest.fixture
+    def root(self):
+        try:
+            root = tk.Tk()
+        except tk.TclError:
+            pytest.skip("No display available")
+        yield root
+        root.destroy()
+
+    def test_cancelled_rename_leaves_profiles_unchanged(self, root, monkeypatch):
+        """Renaming and then cancelling must not touch the manager's profiles."""
+        manager = ProfileManager()
+        manager.create_profile("Default")
+        manager.create_profile("Career")
+        assert manager.get_profile_names() == ["Default", "Career"]
+        monkeypatch.setattr(dialogs, 'ask_string', lambda *args: "Renamed")
+
+        dialog = ProfileDialog(root, manager.profiles, manager.current_profile)
+        dialog.profile_listbox.selection_set(1)
+        dialog._rename_profile()
+        dialog._on_cancel()
+
+        assert dialog.result is None
+        assert manager.profiles[1]['name'] == "Career"
+        assert manager.get_profile_names() == ["Default", "Career"]
@@ -0,0 +1,145 @@
+import hashlib
+import io
+import os
+import pytest
+from src.core.file_ops import (
+    copy_file, copy_files, copy_stream, hash_file, is_same_file,
+    run_parallel, scan_bundles, scan_files, COPY_BUFFER_SIZE
+)
+
+
+class TestFileOps:
+    """Test buffered file copy helpers."""
+
+    def test_copy_file_copies_content(self, tmp_path):
+        """Copied file should match the source byte-for-byte."""
+        src = tmp_path / "src.bundle"
+        dst = tmp_path / "dst.bundle"
+        src.write_bytes(b"bundle data")
+
+        copy_file(src, dst)
+
+        assert dst.read_bytes() == b"bundle data"
+
+    def test_copy_file_preserves_mtime(self, tmp_path):
+        """Metadata should be preserved like shutil.copy2."""
+        src = tmp_path / "src.bundle"
+        dst = tmp_path / "dst.bundle"
+        src.write_bytes(b"data")
+        os.utime(src, (1_600_000_000, 1_600_000_000))
+
+        copy_file(src, dst)
+
+        assert dst.stat().st_mtime == src.stat().st_mtime
+
+    def test_copy_file_overwrites_existing(self, tmp_path):
+        """Existing destination should be replaced."""
+        src = tmp_path / "src.bundle"
+        dst = tmp_path / "dst.bundle"
+        src.write_bytes(b"new")
+        dst.write_bytes(b"old content that is longer")
+
+        copy_file(src, dst)
+
+        assert dst.read_bytes() == b"new"
+
+    @pytest.mark.parametrize("size", [0, 1, COPY_BUFFER_SIZE, COPY_BUFFER_SIZE * 2 + 17])
+    def test_copy_stream_various_sizes(self, size):
+        """Streams spanning multiple buffer lengths should copy intact."""
+        data = os.urandom(size)
+        dst = io.BytesIO()
+
+        copy_stream(io.BytesIO(data), dst)
+
+        assert dst.getvalue() == data
+
+    def test_scan_files_lists_files_only(self, tmp_path):
+        """Scan should return files keyed by case-folded name, skipping folders."""
+        (tmp_path / "UI.bundle").write_text("content")
+        (tmp_path / "subdir").mkdir()
+
+        files = scan_files(tmp_path)
+
+        assert files == {'ui.bundle': str(tmp_path / "UI.bundle")}
+
+    def test_scan_files_missing_directory(self, tmp_path):
+        """Missing directory should scan as empty rather than raising."""
+        assert scan_files(tmp_path / "missing") == {}
+
+    def test_scan_bundles_filters_extension(self, tmp_path):
+        """Only .bundle files should be listed, matching the extension case-insensitively."""
+        (tmp_path / "ui.bundle").write_text("content")
+        (tmp_path / "SOUND.BUNDLE").write_text("content")
+        (tmp_path / "readme.txt").write_text("content")
+        (tmp_path / "dir.bundle").mkdir()
+
+        bundles = sorted(scan_bundles(tmp_path))
+
+        assert bundles == [
+            ("SOUND.BUNDLE", str(tmp_path / "SOUND.BUNDLE")),
+            ("ui.bundle", str(tmp_path / "ui.bundle")),
+        ]
+
+    def test_scan_bundles_missing_directory(self, tmp_path):
+        """Missing directory should scan as empty rather than raising."""
+        assert scan_bundles(tmp_path / "missing") == []
+
+    def test_copy_files_reports_errors_per_file(self, tmp_path):
+        """A failed copy should not stop the rest of the batch."""
+        src = tmp_path / "src.bundle"
+        src.write_bytes(b"data")
+
+        errors = copy_files([
+            (src, tmp_path / "a.bundle"),
+            (tmp_path / "missing.bundle", tmp_path / "b.bundle"),
+        ])
+
+        assert errors[0] is None
+        assert isinstance(errors[1], FileNotFoundError)
+        assert (tmp_path / "a.bundle").read_bytes() == b"data"
+
+    def test_run_parallel_keeps_order_and_errors(self):
+        """Results should line up with the items, with exceptions in place."""
+        def _invert(value):
+            return 1 / value
+
+        results = run_parallel(_invert, [1, 0, 4])
+
+        assert results[0] == 1
+        assert isinstance(results[1], ZeroDivisionError)
+        assert results[2] == 0.25
+
+    def test_hash_file_matches_sha256(self, tmp_path):
+        """File hash should be the SHA-256 of its contents."""
+        path = tmp_path / "file.bundle"
+        path.write_bytes(b"bundle data")
+
+        assert hash_file(path) == hashlib.sha256(b"bundle data").hexdigest()
+
+    def test_is_same_file_after_copy(self, tmp_path):
+        """A copy made with copy_file should match by size and mtime."""
+        src = tmp_path / "src.bundle"
+        dst = tmp_path / "dst.bundle"
+        src.write_bytes(b"data")
+        copy_file(src, dst)
+
+        assert is_same_file(src, dst)
+
+    def test_is_same_file_missing_destination(self, tmp_path):
+        """Missing destination never matches."""
+        src = tmp_path / "src.bundle"
+        src.write_bytes(b"data")
+
+        assert not is_same_file(src, tmp_path / "missing.bundle")
+
+    def test_is_same_file_falls_back_to_hash(self, tmp_path):
+        """Same-size files with different mtimes are compared by hash."""
+        src = tmp_path / "src.bundle"
+        dst = tmp_path / "dst.bundle"
+        src.write_bytes(b"data")
+        dst.write_bytes(b"diff")
+        os.utime(dst, (1_600_000_000, 1_600_000_000))
+
+        assert not is_same_file(src, dst)
+        assert not is_same_file(src, dst, hashlib.sha256(b"data").hexdigest())
+        assert is_same_file(src, dst, hashlib.sha256(b"diff").hexdigest())
@@ -1,3 +1,5 @@
+import hashlib
+import os
 import pytest
 import zipfile
 from pathlib import Path
@@ -33,10 +35,9 @@ class TestModManager:
         """Successfully extract ZIP archive with bundle files."""
         bundle_files = ['file1.bundle', 'file2.bundle']
         zip_path = create_test_zip(bundle_files)
-        temp_dir = tmp_path / "temp"
 
         success, extracted_files, error, traceback = mod_manager.extract_mod(
-            str(zip_path), "Test Mod", temp_dir
+            str(zip_path), "Test Mod"
         )
 
         assert success is True
@@ -45,77 +46,192 @@ class TestModManager:
         assert len(extracted_files) == 2
         assert all(f.suffix == '.bundle' for f in extracted_files)
 
+    def test_extract_mod_writes_directly_to_storage(self, mod_manager, tmp_path):
+        """Bundles should be streamed into mod storage without a temp directory."""
+        zip_path = tmp_path / "nested.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("mod/data/file1.bundle", "content of file1")
+            zf.writestr("mod/readme.txt", "not a bundle")
+
+        success, extracted_files, _, _ = mod_manager.extract_mod(str(zip_path), "Test Mod")
+
+        mod_storage = mod_manager.mod_storage_dir / "Test Mod"
+        assert success is True
+        assert extracted_files == [mod_storage / "file1.bundle"]
+        assert (mod_storage / "file1.bundle").read_text() == "content of file1"
+        assert not (mod_storage / "readme.txt").exists()
+
+    def test_extract_mod_duplicate_file_names(self, mod_manager, tmp_path):
+        """Members with the same file name should extract once, last one winning."""
+        zip_path = tmp_path / "dupes.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("a/ui.bundle", "first")
+            zf.writestr("b/ui.bundle", "second")
+            zf.writestr("b/kits.bundle", "kits")
+
+        success, extracted_files, _, _ = mod_manager.extract_mod(str(zip_path), "Test Mod")
+
+        mod_storage = mod_manager.mod_storage_dir / "Test Mod"
+        assert success is True
+        assert sorted(f.name for f in extracted_files) == ["kits.bundle", "ui.bundle"]
+        assert (mod_storage / "ui.bundle").read_text() == "second"
+
+    def test_extract_mod_file_names_differing_in_case(self, mod_manager, tmp_path):
+        """Names differing only in case are one file on Windows and macOS, so the last one wins."""
+        zip_path = tmp_path / "dupes.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("a/UI.bundle", "first")
+            zf.writestr("b/ui.bundle", "second")
+
+        success, extracted_files, _, _ = mod_manager.extract_mod(str(zip_path), "Test Mod")
+        mod_entry = mod_manager.create_mod_entry("Test Mod", extracted_files)
+
+        mod_storage = mod_manager.mod_storage_dir / "Test Mod"
+        assert success is True
+        assert extracted_files == [mod_storage / "ui.bundle"]
+        assert (mod_storage / "ui.bundle").read_text() == "second"
+        assert mod_entry['files'] == ["ui.bundle"]
+
+    def test_extract_mod_rar_reads_members_from_one_handle(self, mod_manager, tmp_path, monkeypatch):
+        """RAR members should be extracted in turn from a single archive handle."""
+        zip_path = tmp_path / "mod.zip"
+        with zipfile.ZipFile(zip_path, 'w') as zf:
+            zf.writestr("ui.bundle", "ui")
+            zf.writestr("kits.bundle", "kits")
+        opened = []
+
+        def _open_archive(archive_path):
+            opened.append(archive_path)
+            return zipfile.ZipFile(zip_path, 'r')
+
+        monkeypatch.setattr(ModManager, '_open_archive', staticmethod(_open_archive))
+
+        success, extracted_files, _, _ = mod_manager.extract_mod(str(tmp_path / "mod.rar"), "Test Mod")
+
+        mod_storage = mod_manager.mod_storage_dir / "Test Mod"
+        assert success is True
+        assert len(opened) == 1
+        assert sorted(f.name for f in extracted_files) == ["kits.bundle", "ui.bundle"]
+        assert (mod_storage / "kits.bundle").read_text() == "kits"
+
     def test_extract_mod_no_bundle_files(self, mod_manager, tmp_path):
         """ZIP without bundle files should fail with descriptive error."""
         zip_path = tmp_path / "empty.zip"
         with zipfile.ZipFile(zip_path, 'w') as zf:
             zf.writestr("readme.txt", "This is not a bundle file")
 
-        temp_dir = tmp_path / "temp"
         success, files, error, _ = mod_manager.extract_mod(
-            str(zip_path), "Test Mod", temp_dir
+            str(zip_path), "Test Mod"
         )
 
         assert success is False
         assert files is None
         assert "No .bundle files found" in error
+        assert not (mod_manager.mod_storage_dir / "Test Mod").exists()
 
     def test_extract_mod_unsupported_format(self, mod_manager, tmp_path):
         """Unsupported archive format should fail."""
         archive_path = tmp_path / "test.tar.gz"
         archive_path.touch()
 
-        temp_dir = tmp_path / "temp"
         success, files, error, _ = mod_manager.extract_mod(
-            str(archive_path), "Test Mod", temp_dir
+            str(archive_path), "Test Mod"
         )
 
         assert success is False
         assert "Only ZIP and RAR archives are supported" in error
 
-    def test_install_mod_success(self, mod_manager, tmp_path):
-        """Successfully install mod files to storage."""
-        bundle_files = [
-            tmp_path / "file1.bundle",
-            tmp_path / "file2.bundle"
-        ]
-        for f in bundle_files:
-            f.write_text(f"content of {f.name}")
-
-        success, error = mod_manager.install_mod("Test Mod", bundle_files)
+    def test_extract_and_add_mod_entry(self, mod_manager, create_test_zip):
+        """An extracted mod should be stored and tracked once its entry is added."""
+        zip_path = create_test_zip(['file1.bundle', 'file2.bundle'])
 
+        success, bundle_files, error, _ = mod_manager.extract_mod(str(zip_path), "Test Mod")
         assert success is True
         assert error is None
+        mod_entry = mod_manager.create_mod_entry("Test Mod", bundle_files)
+        mod_manager.add_mod_entry(mod_entry)
 
         mod_storage = mod_manager.mod_storage_dir / "Test Mod"
-        assert mod_storage.exists()
-        assert (mod_storage / "file1.bundle").exists()
-        assert (mod_storage / "file2.bundle").exists()
-
-    def test_install_mod_overwrites_existing(self, mod_manager, tmp_path):
-        """Installing mod with same name should overwrite existing."""
-        bundle_file = tmp_path / "file.bundle"
-        bundle_file.write_text("original content")
+        assert mod_manager.get_mod_by_name("Test Mod") is mod_entry
+        assert mod_entry['file_paths'] == {
+            'file1.bundle': str(mod_storage / "file1.bundle"),
+            'file2.bundle': str(mod_storage / "file2.bundle"),
+        }
+        assert (mod_storage / "file1.bundle").read_text() == "content of file1.bundle"
 
-        mod_manager.install_mod("Test Mod", [bundle_file])
+    def test_extract_mod_overwrites_existing(self, mod_manager, tmp_path):
+        """Extracting a mod with the same name should replace its stored files."""
+        old_zip = tmp_path / "old.zip"
+        with zipfile.ZipFile(old_zip, 'w') as zf:
+            zf.writestr("file.bundle", "original content")
+            zf.writestr("stale.bundle", "stale")
+        new_zip = tmp_path / "new.zip"
+        with zipfile.ZipFile(new_zip, 'w') as zf:
+            zf.writestr("file.bundle", "new content")
 
-        bundle_file.write_text("new content")
-        success, error = mod_manager.install_mod("Test Mod", [bundle_file])
+        mod_manager.extract_mod(str(old_zip), "Test Mod")
+        success, _, _, _ = mod_manager.extract_mod(str(new_zip), "Test Mod")
 
+        mod_storage = mod_manager.mod_storage_dir / "Test Mod"
         assert success is True
-        mod_file = mod_manager.mod_storage_dir / "Test Mod" / "file.bundle"
-        assert mod_file.read_text() == "new content"
+        assert (mod_storage / "file.bundle").read_text() == "new content"
+        assert not (mod_storage / "stale.bundle").exists()
+
+    def test_list_bundles(self, mod_manager, tmp_path):
+        """Bundle names should be read from the archive index."""
+        archive_path = tmp_path / "mod.zip"
+        with zipfile.ZipFile(archive_path, 'w') as zf:
+            zf.writestr("data/ui.bundle", "content")
+            zf.writestr("readme.txt", "content")
+
+        names, error = mod_manager.list_bundles(str(archive_path))
+
+        assert error is None
+        assert names == ["ui.bundle"]
+        assert not (mod_manager.mod_storage_dir / "mod").exists()
+
+    def test_list_bundles_no_bundles(self, mod_manager, tmp_path):
+        """Archives without bundle files should be rejected."""
+        archive_path = tmp_path / "mod.zip"
+        with zipfile.ZipFile(archive_path, 'w') as zf:
+            zf.writestr("readme.txt", "content")
+
+        names, error = mod_manager.list_bundles(str(archive_path))
+
+        assert names is None
+        assert "No .bundle files found" in error
+
+    def test_list_bundles_invalid_rar(self, mod_manager, tmp_path):
+        """Corrupt RAR archives should return an error instead of raising."""
+        archive_path = tmp_path / "mod.rar"
+        archive_path.write_bytes(b"not a rar archive")
+
+        names, error = mod_manager.list_bundles(str(archive_path))
+
+        assert names is None
+        assert "Could not read the archive" in error
+
+    def test_list_bundles_unsupported_format(self, mod_manager, tmp_path):
+        """Unsupported archive formats should return an error."""
+        archive_path = tmp_path / "mod.7z"
+        archive_path.write_bytes(b"data")
+
+        names, error = mod_manager.list_bundles(str(archive_path))
+
+        assert names is None
+        assert "Only ZIP and RAR" in error
 
     def test_create_mod_entry(self, mod_manager, tmp_path):
         """Create proper mod metadata entry."""
+        mod_storage = mod_manager.mod_storage_dir / "Test Mod"
+        mod_storage.mkdir()
         bundle_files = [
-            tmp_path / "file1.bundle",
-            tmp_path / "file2.bundle"
+            mod_storage / "file1.bundle",
+            mod_storage / "file2.bundle"
         ]
         for f in bundle_files:
             f.write_text("content")
 
-        mod_manager.install_mod("Test Mod", bundle_files)
         mod_entry = mod_manager.create_mod_entry("Test Mod", bundle_files)
 
         assert mod_entry['name'] == "Test Mod"
@@ -128,6 +244,21 @@ class TestModManager:
 
         date = datetime.fromisoformat(mod_entry['added_date'])
         assert isinstance(date, datetime)
+        assert mod_entry['hashes']['file1.bundle'] == hashlib.sha256(b"content").hexdigest()
+
+    def test_create_mod_entry_reuses_extraction_hashes(self, mod_manager, tmp_path):
+        """Digests taken while extracting should be used for the entry."""
+        archive_path = tmp_path / "mod.zip"
+        with zipfile.ZipFile(archive_path, 'w') as zf:
+            zf.writestr("ui.bundle", "ui content")
+
+        success, bundle_files, _, _ = mod_manager.extract_mod(str(archive_path), "Test Mod")
+        assert success is True
+
+        mod_entry = mod_manager.create_mod_entry("Test Mod", bundle_files)
+
+        assert mod_entry['hashes'] == {'ui.bundle': hashlib.sha256(b"ui content").hexdigest()}
+        assert mod_manager._extracted_hashes == {}
 
     def test_validate_mod_name_valid(self, mod_manager):
         """Valid unique mod name should pass."""
@@ -189,14 +320,38 @@ class TestModManager:
         assert conflicts['file1.bundle'] == 'Mod A'
         assert conflicts['file2.bundle'] == 'Mod B'
 
+    def test_check_conflicts_tracks_enabled_state(self, mod_manager):
+        """Conflict index should follow enable/disable changes."""
+        mod_a = {'name': 'Mod A', 'enabled': False, 'files': ['file1.bundle']}
+        mod_manager.mods = [mod_a]
+
+        assert mod_manager.check_conflicts(['file1.bundle']) == {}
+
+        mod_manager.set_mod_enabled(mod_a, True)
+        assert mod_a['enabled'] is True
+        assert mod_manager.check_conflicts(['file1.bundle']) == {'file1.bundle': 'Mod A'}
+
+        mod_manager.set_mod_enabled(mod_a, False)
+        assert mod_manager.check_conflicts(['file1.bundle']) == {}
+
+    def test_check_conflicts_after_add_and_remove(self, mod_manager):
+        """Adding or removing an enabled mod should update conflicts."""
+        mod_b = {'name': 'Mod B', 'enabled': True, 'files': ['file2.bundle']}
+
+        mod_manager.add_mod_entry(mod_b)
+        assert mod_manager.mods == [mod_b]
+        assert mod_manager.check_conflicts(['file2.bundle']) == {'file2.bundle': 'Mod B'}
+
+        mod_manager.remove_mod_entry(mod_b)
+        assert mod_manager.mods == []
+        assert mod_manager.check_conflicts(['file2.bundle']) == {}
+
     def test_enable_mod_success(self, mod_manager, tmp_path):
         """Successfully enable mod by copying files to game directory."""
         bundle_files = [tmp_path / "src" / "file1.bundle"]
         bundle_files[0].parent.mkdir()
         bundle_files[0].write_text("mod content")
 
-        mod_manager.install_mod("Test Mod", bundle_files)
-
         mod = {
             'name': 'Test Mod',
             'file_paths': {'file1.bundle': str(bundle_files[0])}
@@ -213,6 +368,87 @@ class TestModManager:
         assert (game_data_path / "file1.bundle").exists()
         assert (game_data_path / "file1.bundle").read_text() == "mod content"
 
+    @pytest.mark.parametrize("file_count", [1, 8, 20])
+    def test_enable_mod_copies_all_files(self, mod_manager, tmp_path, file_count):
+        """All mod files should be copied regardless of batch size."""
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        file_paths = {}
+        for i in range(file_count):
+            src = src_dir / f"file{i}.bundle"
+            src.write_text(f"mod content {i}")
+            file_paths[src.name] = str(src)
+
+        game_data_path = tmp_path / "game_data"
+        game_data_path.mkdir()
+
+        success, copied_files, error = mod_manager.enable_mod(
+            {'name': 'Test Mod', 'file_paths': file_paths}, game_data_path
+        )
+
+        assert success is True
+        assert error is None
+        assert sorted(copied_files) == sorted(file_paths)
+        for i in range(file_count):
+            assert (game_data_path / f"file{i}.bundle").read_text() == f"mod content {i}"
+
+    def test_enable_mod_skips_identical_files(self, mod_manager, tmp_path):
+        """Files already matching the stored copy should not be rewritten."""
+        src = tmp_path / "file1.bundle"
+        src.write_text("mod content")
+        game_data_path = tmp_path / "game_data"
+        game_data_path.mkdir()
+        dest = game_data_path / "file1.bundle"
+        dest.write_text("mod content")
+        os.utime(dest, (1_600_000_000, 1_600_000_000))
+
+        mod = {
+            'name': 'Test Mod',
+            'file_paths': {'file1.bundle': str(src)},
+            'hashes': {'file1.bundle': hashlib.sha256(b"mod content").hexdigest()}
+        }
+
+        success, copied_files, error = mod_manager.enable_mod(mod, game_data_path)
+
+        assert success is True
+        assert copied_files == ['file1.bundle']
+        assert dest.stat().st_mtime == 1_600_000_000
+
+    def test_enable_mod_does_not_share_data_with_storage(self, mod_manager, tmp_path):
+        """Writing to an enabled game file in place must leave the stored copy intact."""
+        src = tmp_path / "file1.bundle"
+        src.write_text("mod content")
+        game_data_path = tmp_path / "game_data"
+        game_data_path.mkdir()
+        mod = {'name': 'Test Mod', 'file_paths': {'file1.bundle': str(src)}}
+
+        mod_manager.enable_mod(mod, game_data_path)
+        with open(game_data_path / "file1.bundle", 'r+') as f:
+            f.write("game update")
+
+        assert src.read_text() == "mod content"
+
+    def test_enable_mod_overwrites_different_file_of_same_size(self, mod_manager, tmp_path):
+        """Same-size files with different content must still be copied."""
+        src = tmp_path / "file1.bundle"
+        src.write_text("mod content")
+        game_data_path = tmp_path / "game_data"
+        game_data_path.mkdir()
+        dest = game_data_path / "file1.bundle"
+        dest.write_text("old content")
+        os.utime(dest, (1_600_000_000, 1_600_000_000))
+
+        mod = {
+            'name': 'Test Mod',
+            'file_paths': {'file1.bundle': str(src)},
+            'hashes': {'file1.bundle': hashlib.sha256(b"mod content").hexdigest()}
+        }
+
+        success, _, _ = mod_manager.enable_mod(mod, game_data_path)
+
+        assert success is True
+        assert dest.read_text() == "mod content"
+
     def test_enable_mod_missing_file(self, mod_manager, tmp_path):
         """Enabling mod with missing file should fail."""
         mod = {
@@ -229,6 +465,24 @@ class TestModManager:
         assert error is not None
         assert "missing" in error.lower()
 
+    def test_enable_mods_batches_and_skips_missing(self, mod_manager, tmp_path):
+        """Mods with missing files are reported while the rest are enabled."""
+        src = tmp_path / "file1.bundle"
+        src.write_text("mod content")
+        game_data_path = tmp_path / "game_data"
+        game_data_path.mkdir()
+
+        mods = [
+            {'name': 'Good Mod', 'file_paths': {'file1.bundle': str(src)}},
+            {'name': 'Broken Mod', 'file_paths': {'missing.bundle': str(tmp_path / "missing.bundle")}},
+        ]
+
+        errors = mod_manager.enable_mods(mods, game_data_path)
+
+        assert errors == ["Broken Mod: Mod file missing: missing.bundle"]
+        assert (game_data_path / "file1.bundle").read_text() == "mod content"
+        assert not (game_data_path / "missing.bundle").exists()
+
     def test_get_mod_by_name(self, mod_manager):
         """Get mod metadata by name."""
         mod_manager.mods = [
@@ -248,12 +502,23 @@ class TestModManager:
         mod = mod_manager.get_mod_by_name('Nonexistent')
         assert mod is None
 
-    def test_remove_mod_files(self, mod_manager, tmp_path):
+    def test_get_mod_by_name_after_add_and_remove(self, mod_manager):
+        """Lookups should reflect entries added and removed at runtime."""
+        mod = {'name': 'New Mod', 'enabled': False, 'files': []}
+
+        mod_manager.add_mod_entry(mod)
+        assert mod_manager.get_mod_by_name('New Mod') is mod
+        assert mod_manager.validate_mod_name('New Mod') is not None
+
+        mod_manager.remove_mod_entry(mod)
+        assert mod_manager.get_mod_by_name('New Mod') is None
+        assert mod_manager.validate_mod_name('New Mod') is None
+
+    def test_remove_mod_files(self, mod_manager, create_test_zip):
         """Remove mod files from storage."""
-        bundle_file = tmp_path / "file.bundle"
-        bundle_file.write_text("content")
+        zip_path = create_test_zip(['file.bundle'])
 
-        mod_manager.install_mod("Test Mod", [bundle_file])
+        mod_manager.extract_mod(str(zip_path), "Test Mod")
 
         mod_storage = mod_manager.mod_storage_dir / "Test Mod"
         assert mod_storage.exists()
@@ -276,15 +541,28 @@ class TestModManager:
         assert enabled_mods[0]['name'] == 'Mod 1'
         assert enabled_mods[1]['name'] == 'Mod 3'
 
+    def test_get_enabled_mods_follows_updates(self, mod_manager):
+        """Enabled list should track enable, disable, add and remove."""
+        mod_manager.mods = [{'name': 'Mod 1', 'enabled': False, 'files': []}]
+        mod_1 = mod_manager.get_mod_by_name('Mod 1')
+        mod_2 = {'name': 'Mod 2', 'enabled': True, 'files': []}
+
+        mod_manager.set_mod_enabled(mod_1, True)
+        mod_manager.add_mod_entry(mod_2)
+        assert mod_manager.get_enabled_mods() == [mod_1, mod_2]
+
+        mod_manager.set_mod_enabled(mod_1, False)
+        mod_manager.remove_mod_entry(mod_2)
+        assert mod_manager.get_enabled_mods() == []
+
     @pytest.mark.parametrize("bundle_count", [1, 3, 5, 10])
     def test_extract_various_bundle_counts(self, mod_manager, create_test_zip, tmp_path, bundle_count):
         """Test extracting archives with various numbers of bundles."""
         bundle_files = [f'file{i}.bundle' for i in range(bundle_count)]
         zip_path = create_test_zip(bundle_files)
-        temp_dir = tmp_path / "temp"
 
         success, extracted_files, _, _ = mod_manager.extract_mod(
-            str(zip_path), "Test Mod", temp_dir
+            str(zip_path), "Test Mod"
         )
 
         assert success is True
@@ -39,6 +39,21 @@ class TestPathManager:
         """None input should return None."""
         assert path_manager.get_data_path(None) is None
 
+    def test_get_data_path_cached_until_cleared(self, path_manager, tmp_path):
+        """Lookups should be reused until the cache is cleared."""
+        fm_root = tmp_path / "Football Manager 26"
+        fm_root.mkdir()
+        data_path = fm_root / "fm_Data" / "StreamingAssets" / "aa" / "StandaloneWindows64"
+
+        with patch.object(path_manager, 'system', 'Windows'):
+            assert path_manager.get_data_path(str(fm_root)) is None
+
+            data_path.mkdir(parents=True)
+            assert path_manager.get_data_path(str(fm_root)) is None
+
+            path_manager.clear_cache()
+            assert path_manager.get_data_path(str(fm_root)) == str(data_path)
+
     def test_validate_installation_valid(self, path_manager, tmp_path):
         """Valid FM26 installation structure should pass validation."""
         fm_root = tmp_path / "Football Manager 26"
@@ -132,6 +132,21 @@ class TestProfileManager:
         assert result is True
         assert profile_manager.current_profile == "NewName"
 
+    def test_profile_names_follow_mutations(self, profile_manager):
+        """Cached profile names should refresh after every change."""
+        profile_manager.create_profile("OldName")
+        assert profile_manager.get_profile_names() == ["OldName"]
+
+        profile_manager.rename_profile("OldName", "NewName")
+        assert profile_manager.get_profile_names() == ["NewName"]
+
+        profile_manager.create_profile("Other")
+        profile_manager.delete_profile("NewName")
+        assert profile_manager.get_profile_names() == ["Other"]
+
+        profile_manager.profiles = [{'name': 'Loaded', 'mods': []}]
+        assert profile_manager.get_profile_names() == ["Loaded"]
+
     def test_rename_to_existing_name_fails(self, profile_manager):
         """Should fail when renaming to an existing profile name."""
         profile_manager.create_profile("Profile1")